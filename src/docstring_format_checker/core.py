@@ -136,10 +136,9 @@ class DocstringChecker:
         if file_path.suffix != ".py":
             raise InvalidFileError(f"File must be a Python file (.py): {file_path}")
 
-        # Read and parse the file
+        # Read and parse the file, decoding in one pass rather than through a text wrapper
         try:
-            with open(file_path, encoding="utf-8") as f:
-                content: str = f.read()
+            content: str = file_path.read_bytes().decode("utf-8")
         except UnicodeDecodeError as e:
             raise UnicodeError(f"Cannot decode file {file_path}: {e}") from e
 
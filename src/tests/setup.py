@@ -10,9 +10,14 @@
 ## --------------------------------------------------------------------------- #
 
 
+# ## Future Python Library Imports ----
+from __future__ import annotations
+
 # ## Python StdLib Imports ----
+import os
 import re
-from typing import Any, Callable, Union
+from functools import lru_cache
+from typing import Any, Callable
 
 
 ## --------------------------------------------------------------------------- #
@@ -24,41 +29,58 @@ __all__: list[str] = [
     "name_func_flat_list",
     "name_func_nested_list",
     "name_func_predefined_name",
-    "name_func_predefined_name",
     "clean",
+    "RAM_TEMP_ROOT",
 ]
 
 
+## --------------------------------------------------------------------------- #
+##  Constants                                                               ####
+## --------------------------------------------------------------------------- #
+
+
+NAME_FORMAT = "%s_%02d_%s"
+ANSI_ESCAPE: re.Pattern[str] = re.compile(r"\x1b\[[0-?]*[ -/]*[@-~]")
+
+# RAM-backed location for test files on Linux, when it exists and is writable; `None` means the system default
+RAM_TEMP_ROOT: str | None = "/dev/shm" if os.path.isdir("/dev/shm") and os.access("/dev/shm", os.W_OK) else None
+
+
 ## --------------------------------------------------------------------------- #
 ##  Helper functions                                                        ####
 ## --------------------------------------------------------------------------- #
 
 
+@lru_cache(maxsize=4096)
+def _format_name(name: str, number: int, parts: tuple[str, ...]) -> str:
+    return NAME_FORMAT % (name, number, "_".join(parts))
+
+
 def name_func_flat_list(
     func: Callable,
     idx: int,
-    params: Union[tuple[Any, ...], list[Any]],
+    params: tuple[Any, ...] | list[Any],
 ) -> str:
-    return f"{func.__name__}_{int(idx)+1:02}_{'_'.join([str(param) for param in params[0]])}"
+    row: tuple[Any, ...] | list[Any] = params[0]
+    parts: tuple[str, ...] = tuple(row) if all(type(param) is str for param in row) else tuple(map(str, row))
+    return _format_name(func.__name__, int(idx) + 1, parts)
 
 
 def name_func_nested_list(
     func: Callable,
     idx: int,
-    params: Union[
-        list[Union[tuple[Any, ...], list[Any]]],
-        tuple[Union[tuple[Any, ...], list[Any]], ...],
-    ],
+    params: list[tuple[Any, ...] | list[Any]] | tuple[tuple[Any, ...] | list[Any], ...],
 ) -> str:
-    return f"{func.__name__}_{int(idx)+1:02}_{params[0][0]}_{params[0][1]}"
+    row: tuple[Any, ...] | list[Any] = params[0]
+    return _format_name(func.__name__, int(idx) + 1, (str(row[0]), str(row[1])))
 
 
 def name_func_predefined_name(
     func: Callable,
     idx: int,
-    params: Union[tuple[Any, ...], list[Any]],
+    params: tuple[Any, ...] | list[Any],
 ) -> str:
-    return f"{func.__name__}_{int(idx)+1:02}_{params[0][0]}"
+    return _format_name(func.__name__, int(idx) + 1, (str(params[0][0]),))
 
 
 def strip_ansi_codes(text: str) -> str:
@@ -77,7 +99,7 @@ def strip_ansi_codes(text: str) -> str:
         How it Works:
         - **Input**: Takes a string that may contain ANSI escape sequences
         - **Regex Pattern**: r"\x1b\[[0-?]*[ -/]*[@-~]"
-        - **Processing**: Uses re.sub() to replace all ANSI sequences with empty strings
+        - **Processing**: Returns the text unchanged when it contains no ESC character; otherwise uses the module-level `ANSI_ESCAPE` pattern, compiled once at import, to replace all ANSI sequences with empty strings
         - **Output**: Returns clean text without any formatting codes
 
         Breaking Down the Regex Pattern:
@@ -114,8 +136,9 @@ def strip_ansi_codes(text: str) -> str:
         Final Comment:
         - This function enables **environment-agnostic testing** by normalizing the CLI output to plain text that can be consistently checked across local development and CI environments.
     """
-    ansi_escape: re.Pattern[str] = re.compile(r"\x1b\[[0-?]*[ -/]*[@-~]")
-    return ansi_escape.sub("", text)
+    if "\x1b" not in text:
+        return text
+    return ANSI_ESCAPE.sub("", text)
 
 
 clean = strip_ansi_codes
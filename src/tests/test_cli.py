@@ -11,492 +11,553 @@
 
 
 # ## Python StdLib Imports ----
+import io
 import os
-import shutil
-import sys
 import tempfile
+from contextlib import AbstractContextManager, redirect_stdout
+from inspect import cleandoc
 from pathlib import Path
-from textwrap import dedent
+from typing import Any, Callable, Optional
 from unittest import TestCase
 from unittest.mock import MagicMock, patch
 
 # ## Python Third Party Imports ----
-from click.testing import Result
-from typer.testing import CliRunner
+from click import Command
+from click.testing import CliRunner, Result
+from parameterized import parameterized
+from rich.console import Console
+from typer import Exit
+from typer.main import get_command
 
 # ## Local First Party Imports ----
 from docstring_format_checker import __version__
 from docstring_format_checker.cli import (
+    _display_results,
+    _example_callback,
     _format_error_messages,
     _format_error_output,
     app,
+    check_docstrings,
     entry_point,
 )
 from docstring_format_checker.core import DocstringChecker
 from docstring_format_checker.utils.exceptions import DocstringError
-from tests.setup import clean
+from tests.setup import RAM_TEMP_ROOT, clean, name_func_predefined_name
 
 
 ## --------------------------------------------------------------------------- #
-##  Test Class                                                              ####
+##  Constants                                                               ####
 ## --------------------------------------------------------------------------- #
 
 
-class TestCLI(TestCase):
-    """
-    Test CLI functionality.
-    """
+# Environment that makes Typer emit plain text at a fixed width, so output can be compared without stripping ANSI codes.
+# `FORCE_COLOR` forces Rich into terminal mode whatever its value, so it is unset rather than set to "0".
+CLI_RUNNER_ENV: dict[str, Optional[str]] = {
+    "NO_COLOR": "1",
+    "TERM": "dumb",
+    "TTY_COMPATIBLE": "0",
+    "COLUMNS": "80",
+    "FORCE_COLOR": None,
+}
 
-    def setUp(self) -> None:
-        """
-        Set up test fixtures.
-        """
 
-        self.runner = CliRunner(env={"NO_COLOR": "1"})
+## --------------------------------------------------------------------------- #
+##  Fixtures                                                                ####
+## --------------------------------------------------------------------------- #
 
-    def test_01_help_message(self) -> None:
-        """
-        Test help message is displayed.
-        """
-        result: Result = self.runner.invoke(app, ["--help"])
-        assert result.exit_code == 0
-        assert "A CLI tool to check and validate Python docstring formatting" in clean(result.output)
 
-    def test_02_version_callback(self) -> None:
+GOOD_FUNC_SRC: str = cleandoc(
+    '''
+    def good_function() -> None:
         """
-        Test version callback functionality.
+        !!! note "Summary"
+            This function has a good docstring.
         """
-        result: Result = self.runner.invoke(app, ["--version"])
-        assert result.exit_code == 0
-        assert "docstring-format-checker" in clean(result.output)
+        pass
+    '''
+)
 
-    def test_03_version_option(self) -> None:
-        """
-        Test --version option.
+BAD_FUNC_SRC: str = "def func(): pass"  # Missing docstring
+
+SYNTAX_ERROR_SRC: str = "def func(:\n    pass"  # Invalid syntax
+
+MULTIPLE_BAD_FUNCS_SRC: str = "def a(): pass\ndef b(): pass\ndef c(): pass\n"  # Three missing docstrings
+
+DETAILED_GOOD_FUNC_SRC: str = cleandoc(
+    '''
+    def good_function() -> None:
         """
-        result: Result = self.runner.invoke(app, ["--version"])
-        assert result.exit_code == 0
-        assert f"docstring-format-checker version {__version__}" in clean(result.output)
+        !!! note "Summary"
+            This function has a good docstring.
 
-    def test_04_no_arguments_shows_help(self) -> None:
+        ???+ abstract "Details"
+            More detailed information here.
+
+        Params:
+            None
+
+        Returns:
+            None
         """
-        Test that no arguments shows help.
+        pass
+    '''
+)
+
+PARAMS_AND_RETURNS_FUNC_SRC: str = cleandoc(
+    '''
+    def func() -> None:
         """
-        result: Result = self.runner.invoke(app, [])
-        assert result.exit_code == 0  # CLI shows help and exits gracefully when no path is provided
-        assert "Usage:" in clean(result.output)
-        # More flexible check for the description that handles line wrapping
-        output_clean: str = clean(result.output)
-        assert "A CLI tool to check and validate Python docstring formatting" in output_clean
-        assert "completeness" in output_clean
+        !!! note "Summary"
+            Valid docstring.
 
-    def test_05_example_config_subcommand(self) -> None:
+        Params:
+            None
+
+        Returns:
+            None
         """
-        Test example flag with config option.
+        pass
+    '''
+)
+
+PROJECT_STYLE_FUNC_SRC: str = cleandoc(
+    """
+    def good_function():
+        '''
+        !!! note "Summary"
+            A good function.
+
+        Params:
+            None.
+
+        Returns:
+            (None): Nothing.
+        '''
+        pass
+    """
+)
+
+SUMMARY_ON_FIRST_LINE_FUNC_SRC: str = cleandoc(
+    '''
+    def example_function():
+        """!!! note "Summary"
+        A simple function.
+
+        Params:
+            None
+
+        Returns:
+            None
         """
-        result: Result = self.runner.invoke(app, ["--example=config"])
-        assert result.exit_code == 0
-        assert "[tool.dfc]" in clean(result.output)
-        assert "[tool.docstring-format-checker]" in clean(result.output)
-        assert "sections = [" in clean(result.output)
+        pass
+    '''
+)
 
-    def test_06_nonexistent_file(self) -> None:
+ONE_LINE_DOCSTRING_SRC: str = cleandoc(
+    '''
+    def example_function():
+        """A simple function."""
+        pass
+    '''
+)
+
+MISSING_SUMMARY_SRC: str = cleandoc(
+    '''
+    def invalid_function():
         """
-        Test error handling for nonexistent file.
+        This is missing the required admonition.
         """
-        result: Result = self.runner.invoke(app, ["nonexistent.py"])
-        assert result.exit_code == 1
-        assert "Error: Paths do not exist" in clean(result.output)
+        pass
+    '''
+)
 
-    def test_07_check_valid_python_file(self) -> None:
+COMPOUND_ERRORS_SRC: str = cleandoc(
+    '''
+    def test_function(param1, param2):
         """
-        Test checking a valid Python file.
+        Test function.
+
+        Params:
+            param1 str: Description
+            param2: Missing type information
         """
+        pass
+    '''
+)
 
-        with tempfile.TemporaryDirectory() as temp_dir:
+MISSING_DOCSTRINGS_SRC: str = cleandoc(
+    """
+    def bad_function() -> None:
+        pass
 
-            # Create a temporary Python file
-            temp_path = Path(temp_dir)
-            py_file: Path = temp_path.joinpath("test.py")
-            py_file.write_text(
-                dedent(
-                    '''
-                    def good_function() -> None:
-                        """
-                        !!! note "Summary"
-                            This function has a good docstring.
+    class BadClass:
+        def bad_method(self) -> None:
+            return None
+    """
+)
 
-                        ???+ abstract "Details"
-                            More detailed information here.
+MULTIPLE_FUNCS_SRC: str = cleandoc(
+    """
+    def func1(): pass
+    def func2(): pass
+    class TestClass:
+        def method1(self): pass
+    """
+)
 
-                        Params:
-                            None
+MINIMAL_CONFIG_PATH: Path = Path(__file__).parent.joinpath("fixtures", "minimal_config.toml")
 
-                        Returns:
-                            None
-                        """
-                        pass
-                    '''
-                ).strip()
-            )
+# Written at runtime rather than checked in, so the repo's TOML lint hooks never see it
+MALFORMED_CONFIG_TOML: str = "invalid toml content [[["
 
-            # Should succeed with default config
-            result: Result = self.runner.invoke(app, [str(py_file)])
-            assert result.exit_code == 0
-            assert "All docstrings are valid" in clean(result.output)
+AUTO_DISCOVERY_CONFIG_TOML: str = cleandoc(
+    """
+    [tool.dfc]
+
+    [[tool.dfc.sections]]
+    order = 1
+    name = "summary"
+    type = "free_text"
+    required = true
+    admonition = "note"
+    """
+)
 
-            # Clean up
-            py_file.unlink(missing_ok=True)
+ALT_TABLE_CONFIG_TOML: str = cleandoc(
+    """
+    [tool.docstring-format-checker]
+    sections = [
+        {name = "Summary", required = true, order = 1, type = "free_text"}
+    ]
+    """
+)
 
-    def test_08_check_invalid_python_file(self) -> None:
-        """
-        Test checking a Python file with missing docstrings.
-        """
 
-        with tempfile.TemporaryDirectory() as temp_dir:
+# Read-only sources written once per class by `TestCLI.setUpClass()`, keyed by the name tests look them up with
+FIXTURE_SOURCES: dict[str, str] = {
+    "detailed_good": DETAILED_GOOD_FUNC_SRC,
+    "missing_docstrings": MISSING_DOCSTRINGS_SRC,
+    "missing_summary": MISSING_SUMMARY_SRC,
+    "compound_errors": COMPOUND_ERRORS_SRC,
+    "project_style": PROJECT_STYLE_FUNC_SRC,
+}
 
-            # Create a temporary Python file
-            temp_path = Path(temp_dir)
-            py_file: Path = temp_path.joinpath("test.py")
-            py_file.write_text(
-                dedent(
-                    """
-                    def bad_function() -> None:
-                        pass
 
-                    class BadClass:
-                        def bad_method(self) -> None:
-                            return None
-                    """
-                ).strip()
-            )
+## --------------------------------------------------------------------------- #
+##  Test Class                                                              ####
+## --------------------------------------------------------------------------- #
 
-            # Should fail due to missing docstrings
-            result: Result = self.runner.invoke(app, [str(py_file)])
-            assert result.exit_code == 1  # Should exit with error when docstring errors found
-            assert "error" in clean(result.output).lower()
 
-            # Clean up
-            py_file.unlink(missing_ok=True)
+class TestCLI(TestCase):
+    """
+    Test CLI functionality.
+    """
 
-    def test_09_check_directory(self) -> None:
+    @classmethod
+    def setUpClass(cls) -> None:
         """
-        Test checking a directory.
+        Write the shared, read-only fixture files once for the whole class.
         """
 
-        with tempfile.TemporaryDirectory() as temp_dir:
+        # The CLI's Rich console reads colour settings when it is created, so swap in a plain one for every test
+        cls._console_patcher = patch(
+            "docstring_format_checker.cli.console", Console(no_color=True, force_terminal=False, width=80)
+        )
+        cls._console_patcher.start()
 
-            # Create a Python file with missing docstrings
-            temp_path = Path(temp_dir)
-            py_file: Path = temp_path.joinpath("test.py")
-            py_file.write_text(
-                dedent(
-                    """
-                    def function_without_docstring() -> None:
-                        pass
-                    """
-                ).strip()
-            )
+        # `CliRunner.invoke()` keeps no state between calls, so one runner serves every test
+        cls.runner = CliRunner(env=CLI_RUNNER_ENV)
 
-            # Should find issues in the directory
-            result: Result = self.runner.invoke(app, [str(temp_path)])
-            assert result.exit_code == 1  # Should exit with error when docstring errors found
+        # Typer rebuilds the Click command tree on every call, so build it once and invoke that directly
+        cls.cli: Command = get_command(app)
 
-            # Clean up
-            py_file.unlink(missing_ok=True)
+        # Prefer a RAM-backed location on Linux so fixture I/O never touches the disk
+        cls._tmp = tempfile.TemporaryDirectory(dir=RAM_TEMP_ROOT)
+        cls.root: Path = Path(cls._tmp.name)
 
-    def test_10_exclude_patterns(self) -> None:
-        """
-        Test excluding files with patterns.
-        """
+        cls.good_py: Path = cls.root.joinpath("good.py")
+        cls.good_py.write_text(GOOD_FUNC_SRC)
 
-        with tempfile.TemporaryDirectory() as temp_dir:
+        cls.other_good_py: Path = cls.root.joinpath("other_good.py")
+        cls.other_good_py.write_text(GOOD_FUNC_SRC)
 
-            # Create files
-            temp_path = Path(temp_dir)
-            test_file: Path = temp_path.joinpath("test_something.py")
-            regular_file: Path = temp_path.joinpath("regular.py")
+        cls.bad_py: Path = cls.root.joinpath("bad.py")
+        cls.bad_py.write_text(BAD_FUNC_SRC)
 
-            # Write to files
-            test_file.write_text("def func(): pass")
-            regular_file.write_text("def func(): pass")
+        cls.syntax_error_py: Path = cls.root.joinpath("syntax_error.py")
+        cls.syntax_error_py.write_text(SYNTAX_ERROR_SRC)
 
-            # Should only check regular.py and find issues
-            result: Result = self.runner.invoke(app, ["--exclude", "test_*.py", str(temp_path)])
-            assert result.exit_code == 1  # Should exit with error when docstring errors found
+        cls.fixtures: dict[str, Path] = {}
+        for name, source in FIXTURE_SOURCES.items():
+            cls.fixtures[name] = cls.root.joinpath(f"{name}.py")
+            cls.fixtures[name].write_text(source)
 
-            # Clean up
-            Path(test_file).unlink(missing_ok=True)
-            Path(regular_file).unlink(missing_ok=True)
+        cls.config_toml: Path = MINIMAL_CONFIG_PATH
 
-    def test_11_quiet_option(self) -> None:
+        cls.malformed_toml: Path = cls.root.joinpath("malformed_config.toml")
+        cls.malformed_toml.write_text(MALFORMED_CONFIG_TOML)
+
+        # Shared stand-in for the checker, reset before every test
+        cls.mock_checker = MagicMock(spec=DocstringChecker)
+
+    @classmethod
+    def tearDownClass(cls) -> None:
         """
-        Test quiet option suppresses success messages.
+        Remove the shared fixture files.
         """
 
-        with tempfile.TemporaryDirectory() as temp_dir:
-
-            # Create a temporary Python file
-            temp_path = Path(temp_dir)
-            py_file: Path = temp_path.joinpath("test.py")
-            py_file.write_text(
-                dedent(
-                    '''
-                    def good_function() -> None:
-                        """
-                        !!! note "Summary"
-                            This function has a good docstring.
-                        """
-                        pass
-                    '''
-                ).strip()
-            )
+        cls._tmp.cleanup()
+        cls._console_patcher.stop()
 
-            # Should succeed without any output
-            result: Result = self.runner.invoke(app, ["--quiet", str(py_file)])
-            assert result.exit_code == 0
-            assert clean(result.output).strip() == ""
+    def setUp(self) -> None:
+        """
+        Set up test fixtures.
+        """
 
-            # Clean up
-            py_file.unlink(missing_ok=True)
+        self.temp_path: Path = Path(tempfile.mkdtemp(dir=self.root))
+        self.mock_checker.reset_mock(side_effect=True)
 
-    def test_12_table_output_option(self) -> None:
+    def _exit_code(self, args: list[str]) -> int:
         """
-        Test table output option shows detailed output.
+        Run the CLI command in-process with its output discarded, for tests that only assert on the exit code.
         """
+        with open(os.devnull, "w") as sink, redirect_stdout(sink):
+            return self.cli.main(args=args, standalone_mode=False) or 0
 
-        with tempfile.TemporaryDirectory() as temp_dir:
-
-            # Create a temporary Python file
-            temp_path = Path(temp_dir)
-            py_file: Path = temp_path.joinpath("test.py")
-            py_file.write_text("def func(): pass")
+    def _check(self, paths: list[str], **kwargs: Any) -> tuple[int, str]:
+        """
+        Run `check_docstrings()` directly, bypassing Typer argument parsing, and capture its exit code and output.
+        """
+        buffer = io.StringIO()
+        exit_code: int = 0
+        with redirect_stdout(buffer):
+            try:
+                check_docstrings(paths=paths, **kwargs)
+            except Exit as e:
+                exit_code = e.exit_code
+        return exit_code, buffer.getvalue()
 
-            # Should show table output
-            result: Result = self.runner.invoke(app, ["--output=table", str(py_file)])
-            # Table output should contain the header elements
-            output = clean(result.output)
-            assert "File" in output and "Line" in output and "Item" in output
+    def _patched_checker(self, method: str, error: Exception) -> AbstractContextManager[Any]:
+        """
+        Make the shared mock checker raise `error` from `method`, and return a patch that hands it to the CLI.
+        """
+        getattr(self.mock_checker, method).side_effect = error
+        return patch("docstring_format_checker.cli.DocstringChecker", return_value=self.mock_checker)
 
-            # Clean up
-            py_file.unlink(missing_ok=True)
+    def _run_callback(self, callback: Callable[..., None], value: Any) -> tuple[int, str]:
+        """
+        Call an eager option callback directly, skipping Typer's context setup, and capture its exit code and output.
+        """
+        buffer = io.StringIO()
+        exit_code: int = 0
+        with redirect_stdout(buffer):
+            try:
+                callback(MagicMock(resilient_parsing=False), MagicMock(), value)
+            except Exit as e:
+                exit_code = e.exit_code
+        return exit_code, buffer.getvalue()
 
-    def test_13_custom_config_file(self) -> None:
+    def test_01_help_message(self) -> None:
         """
-        Test using a custom configuration file.
+        Test help message is displayed.
         """
+        result: Result = self.runner.invoke(self.cli, ["--help"], catch_exceptions=False)
+        # Strip any ANSI codes and collapse whitespace, so the check tolerates styled or wrapped help output
+        output: str = " ".join(clean(result.output).split())
+        assert result.exit_code == 0
+        assert "A CLI tool to check and validate Python docstring formatting and completeness" in output
 
-        with tempfile.TemporaryDirectory() as temp_dir:
+    @parameterized.expand(
+        input=[
+            ("long", ["--version"]),
+            ("short", ["-v"]),
+        ],
+        name_func=name_func_predefined_name,
+    )
+    def test_03_version_option(self, name: str, args: list[str]) -> None:
+        """
+        Test --version option and its -v alias.
+        """
+        result: Result = self.runner.invoke(self.cli, args, catch_exceptions=False)
+        assert result.exit_code == 0
+        assert f"docstring-format-checker version {__version__}" in result.output
 
-            # Create a temporary config file
-            temp_path = Path(temp_dir)
-            config_file: Path = temp_path.joinpath("test_config.toml")
-            config_file.write_text(
-                dedent(
-                    """
-                    [tool.dfc]
-                    [[tool.dfc.sections]]
-                    order = 1
-                    name = "summary"
-                    type = "free_text"
-                    required = true
-                    """
-                ).strip()
-            )
+    def test_04_no_arguments_shows_help(self) -> None:
+        """
+        Test that no arguments shows help.
+        """
+        result: Result = self.runner.invoke(self.cli, [], catch_exceptions=False)
+        assert result.exit_code == 0  # CLI shows help and exits gracefully when no path is provided
+        # Strip any ANSI codes and collapse whitespace, so the check tolerates styled or wrapped help output
+        output: str = " ".join(clean(result.output).split())
+        assert "Usage:" in output
+        assert "A CLI tool to check and validate Python docstring formatting and completeness" in output
 
-            # Create a temporary Python file
-            py_file: Path = temp_path.joinpath("test.py")
-            py_file.write_text("def func(): pass")
+    def test_05_example_config_subcommand(self) -> None:
+        """
+        Test example flag with config option.
+        """
+        result: Result = self.runner.invoke(self.cli, ["-e", "config"], catch_exceptions=False)
+        output: str = result.output
+        assert result.exit_code == 0
+        assert "Configuration Example" in output
+        assert "Place the below config in your `pyproject.toml` file" in output
+        assert "[tool.dfc]" in output
+        assert "[tool.docstring-format-checker]" in output
+        assert "sections = [" in output
 
-            # Should use the custom config
-            result: Result = self.runner.invoke(app, ["--config", str(config_file), str(py_file)])
-            assert result.exit_code == 1  # Should exit with error when docstring errors found
+    def test_07_check_valid_python_file(self) -> None:
+        """
+        Test checking a valid Python file.
+        """
 
-            # Clean up
-            config_file.unlink(missing_ok=True)
-            py_file.unlink(missing_ok=True)
+        # Should succeed with default config
+        exit_code, output = self._check([str(self.fixtures["detailed_good"])])
+        assert exit_code == 0
+        assert "All docstrings are valid" in output
 
-    def test_14_nonexistent_config_file(self) -> None:
+    def test_08_check_invalid_python_file(self) -> None:
         """
-        Test error handling for nonexistent config file.
+        Test checking a Python file with missing docstrings.
         """
 
-        with tempfile.TemporaryDirectory() as temp_dir:
+        # Should fail due to missing docstrings
+        exit_code, output = self._check([str(self.fixtures["missing_docstrings"])])
+        assert exit_code == 1  # Should exit with error when docstring errors found
+        assert "error" in output.lower()
 
-            # Create a temporary Python file
-            temp_path = Path(temp_dir)
-            py_file: Path = temp_path.joinpath("test.py")
-            py_file.write_text("def func(): pass")
+    def test_09_check_directory(self) -> None:
+        """
+        Test checking a directory.
+        """
 
-            result: Result = self.runner.invoke(app, ["--config", "nonexistent.toml", str(py_file)])
-            assert result.exit_code == 1
-            assert "Configuration file does not exist" in clean(result.output)
+        # Create a Python file with missing docstrings
+        py_file: Path = self.temp_path.joinpath("test.py")
+        py_file.write_text(BAD_FUNC_SRC)
 
-            # Clean up
-            py_file.unlink(missing_ok=True)
+        # Should find issues in the directory
+        exit_code, _ = self._check([str(self.temp_path)])
+        assert exit_code == 1  # Should exit with error when docstring errors found
 
-    def test_15_directory_recursive_default_behavior(self) -> None:
+    def test_10_exclude_patterns(self) -> None:
         """
-        Test that directories are checked recursively by default.
+        Test excluding files with patterns.
         """
 
-        with tempfile.TemporaryDirectory() as temp_dir:
-
-            # Create subdirectory with Python file that has docstring issues
-            temp_path = Path(temp_dir)
-            subdir: Path = temp_path.joinpath("subdir")
-            subdir.mkdir()
-            py_file: Path = subdir.joinpath("test.py")
-            py_file.write_text("def func(): pass")  # Missing docstring
-
-            # Test default behavior (should check recursively)
-            result: Result = self.runner.invoke(app, [str(temp_path)])
+        # Create files
+        test_file: Path = self.temp_path.joinpath("test_something.py")
+        regular_file: Path = self.temp_path.joinpath("regular.py")
 
-            # Should find issues in subdirectory (default behavior is recursive)
-            assert result.exit_code == 1
+        # Write to files
+        test_file.write_text(BAD_FUNC_SRC)
+        regular_file.write_text(BAD_FUNC_SRC)
 
-            # Clean up
-            py_file.unlink(missing_ok=True)
+        # Should only check regular.py and exit with error when docstring errors found
+        assert self._exit_code(["--exclude", "test_*.py", str(self.temp_path)]) == 1
 
-    def test_16_example_config_subcommand_content(self) -> None:
+    @parameterized.expand(
+        input=[
+            ("quiet", ["--quiet"]),
+            ("quiet_check", ["--quiet", "--check"]),
+        ],
+        name_func=name_func_predefined_name,
+    )
+    def test_11_quiet_option(self, name: str, flags: list[str]) -> None:
         """
-        Test example flag config content.
+        Test quiet option suppresses success messages.
         """
-        result: Result = self.runner.invoke(app, ["--example=config"])
+
+        # Should succeed without any output
+        result: Result = self.runner.invoke(self.cli, [*flags, str(self.good_py)], catch_exceptions=False)
         assert result.exit_code == 0
-        assert "Place the below config in your `pyproject.toml` file" in clean(result.output)
+        assert result.output.strip() == ""
 
-    def test_17_example_usage_subcommand(self) -> None:
+    def test_13_custom_config_file(self) -> None:
         """
-        Test example flag with usage option.
+        Test using a custom configuration file.
         """
-        result: Result = self.runner.invoke(app, ["--example=usage"])
-        assert result.exit_code == 0
-        assert "Examples" in clean(result.output)
 
-    def test_18_help_callback(self) -> None:
+        # Should use the custom config and exit with error when docstring errors found
+        assert self._exit_code(["--config", str(self.config_toml), str(self.bad_py)]) == 1
+
+    def test_15_directory_recursive_default_behavior(self) -> None:
         """
-        Test help callback functionality.
+        Test that directories are checked recursively by default.
         """
-        result: Result = self.runner.invoke(app, ["--help"])
-        assert result.exit_code == 0
-        # More flexible check for the description that handles line wrapping
-        output: str = clean(result.output)
-        assert all(
-            word in output
-            for word in "A CLI tool to check and validate Python docstring formatting and completeness".split(" ")
-        )
+
+        # Create subdirectory with Python file that has docstring issues
+        subdir: Path = self.temp_path.joinpath("subdir")
+        subdir.mkdir()
+        py_file: Path = subdir.joinpath("test.py")
+        py_file.write_text(BAD_FUNC_SRC)  # Missing docstring
+
+        # Test default behavior (should check recursively)
+        exit_code, _ = self._check([str(self.temp_path)])
+
+        # Should find issues in subdirectory (default behavior is recursive)
+        assert exit_code == 1
 
     def test_19_entry_point_function(self) -> None:
         """
-        Test entry_point function.
+        Test entry_point function delegates to the Typer app.
         """
 
-        # Mock sys.argv to simulate command line call
-        with patch.object(sys, "argv", ["dfc", "--version"]):
-            try:
-                entry_point()
-            except SystemExit:
-                pass  # Expected for --version
+        # The app itself is exercised by the other tests; only the wiring is checked here
+        with patch("docstring_format_checker.cli.app") as mock_app:
+            entry_point()
+        mock_app.assert_called_once_with()
 
     def test_20_config_error_handling(self) -> None:
         """
         Test configuration error handling in check command.
         """
 
-        with tempfile.TemporaryDirectory() as temp_dir:
-
-            # Create a temporary Python file
-            temp_path = Path(temp_dir)
-            py_file: Path = temp_path.joinpath("test.py")
-            py_file.write_text("def good_function():\n    '''This has a docstring.'''\n    pass")
-
-            # Test with malformed config file
-            config_file: Path = temp_path.joinpath("bad_config.toml")
-            config_file.write_text("invalid toml content [[[")
-
-            # Invoke the check command with the bad config file
-            result: Result = self.runner.invoke(app, ["--config", str(config_file), str(py_file)])
-            assert result.exit_code == 1  # Changed from 2 to 1
-            assert "error" in clean(result.output).lower()
-
-            # Clean up
-            py_file.unlink(missing_ok=True)
-            config_file.unlink(missing_ok=True)
+        # Invoke the check command with the malformed config file
+        result: Result = self.runner.invoke(self.cli, ["--config", str(self.malformed_toml), str(self.good_py)])
+        assert result.exit_code == 1  # Changed from 2 to 1
+        assert "error" in result.output.lower()
 
     def test_21_verbose_config_loading(self) -> None:
         """
         Test verbose output during config loading.
         """
 
-        with tempfile.TemporaryDirectory() as temp_dir:
-
-            # Create a temporary Python file
-            temp_path = Path(temp_dir)
-            py_file: Path = temp_path.joinpath("test.py")
-            py_file.write_text("def good_function():\n    '''This has a docstring.'''\n    pass")
-
-            # Test verbose with default config
-            result: Result = self.runner.invoke(app, ["--output=table", str(py_file)])
+        # Test verbose with default config
+        result: Result = self.runner.invoke(self.cli, ["--output=table", str(self.good_py)])
 
-            # Check if it passes or has expected content
-            assert result.exit_code in [0, 1]  # Allow either success or failure
-
-            # Clean up
-            py_file.unlink(missing_ok=True)
+        # Check if it passes or has expected content
+        assert result.exit_code in [0, 1]  # Allow either success or failure
 
     def test_22_auto_config_discovery(self) -> None:
         """
         Test automatic config file discovery.
         """
 
-        with tempfile.TemporaryDirectory() as temp_dir:
-
-            # Create a Python file
-            temp_path = Path(temp_dir)
-            py_file: Path = temp_path.joinpath("test.py")
-            py_file.write_text(
-                "def good_function():\n"
-                '    """\n'
-                '    !!! note "Summary"\n'
-                "        This has a valid docstring.\n"
-                '    """\n'
-                "    pass"
-            )
-
-            # Create a config file in the same directory
-            config_file: Path = temp_path.joinpath("pyproject.toml")
-            config_file.write_text(
-                dedent(
-                    """
-                    [tool.dfc]
-
-                    [[tool.dfc.sections]]
-                    order = 1
-                    name = "summary"
-                    type = "free_text"
-                    required = true
-                    admonition = "note"
-                """
-                ).strip()
-            )
-
-            # Test that config is auto-discovered
-            # The main goal is code coverage, not functional correctness
-            result: Result = self.runner.invoke(app, ["--output=table", str(py_file)])
-            # For coverage purposes, we just need the auto-discovery code to execute
-            # The exit code depends on config correctness which varies, so we don't assert on it
-            # Just verify that some output was generated, indicating auto-discovery ran
-            assert len(result.output) > 0
+        # Link the shared good fixture into this test's directory
+        py_file: Path = self.temp_path.joinpath("test.py")
+        os.link(self.good_py, py_file)
+
+        # Create a config file in the same directory
+        config_file: Path = self.temp_path.joinpath("pyproject.toml")
+        config_file.write_text(AUTO_DISCOVERY_CONFIG_TOML)
+
+        # Test that config is auto-discovered
+        # The main goal is code coverage, not functional correctness
+        result: Result = self.runner.invoke(self.cli, ["--output=table", str(py_file)])
+        # For coverage purposes, we just need the auto-discovery code to execute
+        # The exit code depends on config correctness which varies, so we don't assert on it
+        # Just verify that some output was generated, indicating auto-discovery ran
+        assert len(result.output) > 0
 
     def test_23_global_examples_callback(self) -> None:
         """
         Test global examples callback functionality.
         """
-        result: Result = self.runner.invoke(app, ["--example=usage"])
-        assert result.exit_code == 0
-        assert "Examples" in clean(result.output)
-        assert "dfc myfile.py" in clean(result.output)
+        exit_code, output = self._run_callback(_example_callback, "usage")
+        assert exit_code == 0
+        assert "Usage Examples" in output
+        assert "Execute the below commands in any terminal" in output
+        assert "dfc myfile.py" in output
 
     def test_24_error_during_checking(self) -> None:
         """
@@ -504,511 +565,207 @@ class TestCLI(TestCase):
         """
 
         # Test with a directory that causes an error during checking
-        with tempfile.TemporaryDirectory() as temp_dir:
-
-            # Create a file with invalid syntax to trigger an error during checking
-            temp_path = Path(temp_dir)
-            py_file: Path = temp_path.joinpath("invalid.py")
-            py_file.write_text("def func(:\n    pass")  # Invalid syntax
+        # Create a file with invalid syntax to trigger an error during checking
+        py_file: Path = self.temp_path.joinpath("invalid.py")
+        py_file.write_text(SYNTAX_ERROR_SRC)  # Invalid syntax
 
-            # Also create a directory to test the directory checking path
-            result: Result = self.runner.invoke(app, [str(temp_path)])
+        # Also create a directory to test the directory checking path
+        exit_code, _ = self._check([str(self.temp_path)])
 
-            # Should not crash but may return non-zero exit code due to syntax error
-            assert result.exit_code in [0, 1, 2]  # Allow various error codes
+        # Should not crash but may return non-zero exit code due to syntax error
+        assert exit_code in [0, 1, 2]  # Allow various error codes
 
     def test_25_error_summary_display(self) -> None:
         """
         Test error summary display functionality.
         """
 
-        with tempfile.TemporaryDirectory() as temp_dir:
+        # Create two files, each with several missing docstrings; the second is a hard link to the first
+        py_file: Path = self.temp_path.joinpath("test_0.py")
+        py_file.write_text(MULTIPLE_BAD_FUNCS_SRC)
+        os.link(py_file, self.temp_path.joinpath("test_1.py"))
 
-            # Create multiple files with docstring issues
-            temp_path = Path(temp_dir)
-            for i in range(3):
-                py_file: Path = temp_path.joinpath(f"test_{i}.py")
-                py_file.write_text("def func(): pass")  # Missing docstring
-
-            # Should find multiple errors and display summary
-            result: Result = self.runner.invoke(app, [str(temp_path)])
-            assert result.exit_code == 1
-            assert "error(s)" in clean(result.output)
-            assert "functions over" in clean(result.output)
-            assert "files" in clean(result.output)
-
-    def test_26_quiet_mode_single_file_single_function(self) -> None:
-        """
-        Test quiet mode with single file and single function (coverage for total_files == 1 and total_functions == 1).
-        """
-        with tempfile.NamedTemporaryFile(mode="w", suffix=".py", delete=False) as temp_file:
-            temp_file.write("def func(): pass")  # Missing docstring
-            temp_file.flush()
-            temp_file_name = temp_file.name
-
-        try:
-            result: Result = self.runner.invoke(app, ["--quiet", temp_file_name])
-            assert result.exit_code == 1
-            assert "1 error(s) in 1 function over 1 file" in clean(result.output)
-        finally:
-            Path(temp_file_name).unlink(missing_ok=True)
+        # Should find multiple errors and display summary
+        exit_code, output = self._check([str(self.temp_path)])
+        assert exit_code == 1
+        assert "error(s)" in output
+        assert "functions over" in output
+        assert "files" in output
 
     def test_27_quiet_mode_multiple_files_multiple_functions(self) -> None:
         """
         Test quiet mode with multiple files and functions (coverage for else branches).
         """
-        with tempfile.TemporaryDirectory() as temp_dir:
-            temp_path = Path(temp_dir)
-
-            # Create multiple files with multiple functions each
-            for i in range(2):
-                py_file = temp_path / f"test_{i}.py"
-                py_file.write_text(
-                    dedent(
-                        """
-                        def func1(): pass
-                        def func2(): pass
-                        class TestClass:
-                            def method1(self): pass
-                        """
-                    )
-                )
 
-            result: Result = self.runner.invoke(app, ["--quiet", str(temp_path)])
-            assert result.exit_code == 1
-            # This should hit the else branches for multiple functions and files
-            assert "functions over" in clean(result.output)
-            assert "files" in clean(result.output)
+        # Create multiple files with multiple functions each; the second is a hard link to the first
+        py_file: Path = self.temp_path.joinpath("test_0.py")
+        py_file.write_text(MULTIPLE_FUNCS_SRC)
+        os.link(py_file, self.temp_path.joinpath("test_1.py"))
+
+        exit_code, output = self._check([str(self.temp_path)], quiet=True)
+        assert exit_code == 1
+        # This should hit the else branches for multiple functions and files
+        assert "functions over" in output
+        assert "files" in output
 
     def test_28_list_output_with_compound_errors(self) -> None:
         """
         Test list output with compound error messages that contain '; ' separators.
         This tests the missing lines 443-451 in cli.py.
         """
-        with tempfile.NamedTemporaryFile(mode="w", suffix=".py", delete=False) as temp_file:
-            # Create content that would generate compound errors
-            temp_file.write(
-                dedent(
-                    '''
-                def test_function(param1, param2):
-                    """
-                    Test function.
-
-                    Params:
-                        param1 str: Description
-                        param2: Missing type information
-                    """
-                    pass
-                '''
-                ).strip()
-            )
-            temp_file.flush()
-            temp_file_name = temp_file.name
-
-        try:
-            result: Result = self.runner.invoke(app, ["-o", "list", temp_file_name])
-            # This should generate errors with "; " separators that will hit lines 443-451
-            assert result.exit_code == 1
-            output = clean(result.output)
-            assert "param" in output
-        finally:
-            Path(temp_file_name).unlink(missing_ok=True)
+        # Use content that would generate compound errors
+        exit_code, output = self._check([str(self.fixtures["compound_errors"])], output="list")
+        # This should generate errors with "; " separators that will hit lines 443-451
+        assert exit_code == 1
+        assert "param" in output
 
     def test_29_list_output_with_compound_errors_no_line_number(self) -> None:
         """
         Test list output with compound errors that have no line number (line 451).
         """
-        with tempfile.NamedTemporaryFile(mode="w", suffix=".py", delete=False) as temp_file:
-            # Create a file with syntax errors that will generate file-level errors
-            temp_file.write("def broken_syntax(:\n    pass\n")  # Invalid syntax
-            temp_file.flush()
-            temp_file_name = temp_file.name
-
-        try:
-            result: Result = self.runner.invoke(app, ["-o", "list", temp_file_name])
-            # File-level syntax errors have line_number=0, which should hit line 451
-            # The result might be exit code 2 for syntax errors, but we still test the code path
-            output = clean(result.output)
-            # Should contain some error message
-            assert len(output) > 0
-        finally:
-            Path(temp_file_name).unlink(missing_ok=True)
+        # File-level syntax errors have line_number=0, which should hit line 451
+        # The result might be exit code 2 for syntax errors, but we still test the code path
+        _, output = self._check([str(self.syntax_error_py)], output="list")
+        # Should contain some error message
+        assert len(output) > 0
 
     def test_30_check_directory_verbose_message(self) -> None:
         """
         Test verbose message for directory checking.
         """
 
-        with tempfile.TemporaryDirectory() as temp_dir:
-
-            # Create a Python file with proper structure
-            temp_path = Path(temp_dir)
-            py_file: Path = temp_path.joinpath("test.py")
-            py_file.write_text(
-                dedent(
-                    '''
-                    def func() -> None:
-                        """
-                        !!! note "Summary"
-                            Valid docstring.
-
-                        Params:
-                            None
-
-                        Returns:
-                            None
-                        """
-                        pass
-                    '''
-                ).strip()
-            )
-
-            # Should show success message for valid docstrings
-            result: Result = self.runner.invoke(app, ["--output=table", str(temp_path)])
-            assert (
-                result.exit_code == 0
-            ), f"Expected exit code 0, got {result.exit_code}. Output: {clean(result.output)}"
-            assert "✅ All docstrings are valid!" in clean(result.output)
+        # Create a Python file with proper structure
+        py_file: Path = self.temp_path.joinpath("test.py")
+        py_file.write_text(PARAMS_AND_RETURNS_FUNC_SRC)
+
+        # Should show success message for valid docstrings
+        exit_code, output = self._check([str(self.temp_path)], output="table")
+        assert exit_code == 0, f"Expected exit code 0, got {exit_code}. Output: {output}"
+        assert "✅ All docstrings are valid!" in output
 
     def test_31_check_command_exception_handling(self) -> None:
         """
         Test exception handling in check command.
         """
 
-        with tempfile.TemporaryDirectory() as temp_dir:
+        # Mock the DocstringChecker to raise an exception
+        with self._patched_checker("check_directory", Exception("Test error")):
 
-            # Create a file that will cause an exception when processed
-            temp_path = Path(temp_dir)
-            py_file: Path = temp_path.joinpath("test.py")
-            py_file.write_text('def func():\n    """Valid docstring."""\n    pass')
-
-            with patch("docstring_format_checker.cli.DocstringChecker") as mock_checker:
-
-                # Mock the DocstringChecker to raise an exception
-                mock_instance = MagicMock()
-                mock_checker.return_value = mock_instance
-                mock_instance.check_directory.side_effect = Exception("Test error")
-
-                # Should handle the exception and exit with code 1
-                result: Result = self.runner.invoke(app, [str(temp_path)])
-                assert result.exit_code == 1
-                assert "Error during checking: Test error" in clean(result.output)
+            # Should handle the exception and exit with code 1
+            exit_code, output = self._check([str(self.temp_path)])
+            assert exit_code == 1
+            assert "Error during checking: Test error" in output
 
     def test_32_check_file_specific_exception_handling(self) -> None:
         """
         Test exception handling for file checking.
         """
 
-        with tempfile.TemporaryDirectory() as temp_dir:
-
-            # Create a single file
-            temp_path = Path(temp_dir)
-            py_file: Path = temp_path.joinpath("test.py")
-            py_file.write_text('def func():\n    """Valid docstring."""\n    pass')
-
-            with patch("docstring_format_checker.cli.DocstringChecker") as mock_checker:
-
-                # Mock the DocstringChecker to raise an exception for file checking
-                mock_instance = MagicMock()
-                mock_checker.return_value = mock_instance
-                mock_instance.check_file.side_effect = Exception("File check error")
-
-                # Should handle the exception and exit with code 1
-                result: Result = self.runner.invoke(app, [str(py_file)])
-                assert result.exit_code == 1
-                assert "Error during checking: File check error" in clean(result.output)
-
-    def test_33_format_error_messages(self) -> None:
+        # Mock the DocstringChecker to raise an exception for file checking
+        with self._patched_checker("check_file", Exception("File check error")):
+
+            # Should handle the exception and exit with code 1
+            exit_code, output = self._check([str(self.good_py)])
+            assert exit_code == 1
+            assert "Error during checking: File check error" in output
+
+    @parameterized.expand(
+        input=[
+            (
+                "single_error",
+                "Missing required admonition sections: ['Parameters', 'Returns']",
+                "- Missing required admonition sections: ['Parameters', 'Returns'].",
+            ),
+            (
+                "multiple_errors",
+                "Missing required admonition sections: ['Parameters', 'Returns']; Expected closing parenthesis ')'",
+                "- Missing required admonition sections: ['Parameters', 'Returns'];\n- Expected closing parenthesis ')'.",
+            ),
+            ("empty_string", "", "- ."),
+            (
+                "no_double_prefix",
+                "Missing required admonition sections: ['Parameters']",
+                "- Missing required admonition sections: ['Parameters'].",
+            ),
+        ],
+        name_func=name_func_predefined_name,
+    )
+    def test_33_format_error_messages(self, name: str, error_message: str, expected: str) -> None:
         """
         Test that _format_error_messages correctly formats error strings.
         """
-
-        # Test single error
-        single_error = "Missing required admonition sections: ['Parameters', 'Returns']"
-        expected_single = "- Missing required admonition sections: ['Parameters', 'Returns']."
-        assert _format_error_messages(single_error) == expected_single
-
-        # Test multiple errors separated by semicolons
-        multi_error = (
-            "Missing required admonition sections: ['Parameters', 'Returns']; Expected closing parenthesis ')'"
-        )
-        expected_multi = (
-            "- Missing required admonition sections: ['Parameters', 'Returns'];\n- Expected closing parenthesis ')'."
-        )
-        assert _format_error_messages(multi_error) == expected_multi
-
-        # Test empty string
-        assert _format_error_messages("") == "- ."
-
-        # Test string that already has dash prefix (should not double-prefix)
-        prefixed_error = "Missing required admonition sections: ['Parameters']"
-        expected_prefixed = "- Missing required admonition sections: ['Parameters']."
-        assert _format_error_messages(prefixed_error) == expected_prefixed
-
-    def test_34_check_flag_exits_on_error(self) -> None:
-        """
-        Test that --check flag causes exit with error code 1 when issues are found.
-        """
-        with tempfile.TemporaryDirectory() as temp_dir:
-            temp_path = Path(temp_dir)
-            py_file: Path = temp_path.joinpath("test.py")
-            py_file.write_text("def func(): pass")  # Missing docstring
-
-            result: Result = self.runner.invoke(app, ["--check", str(py_file)])
-            assert result.exit_code == 1
-            assert "error" in clean(result.output).lower()
-
-            py_file.unlink(missing_ok=True)
-
-    def test_35_check_flag_succeeds_when_no_errors(self) -> None:
-        """
-        Test that --check flag succeeds with exit code 0 when no issues are found.
-        """
-        with tempfile.TemporaryDirectory() as temp_dir:
-            temp_path = Path(temp_dir)
-            py_file: Path = temp_path.joinpath("test.py")
-            py_file.write_text(
-                dedent(
-                    '''
-                    def good_function() -> None:
-                        """
-                        !!! note "Summary"
-                            This function has a good docstring.
-                        """
-                        pass
-                    '''
-                ).strip()
-            )
-
-            result: Result = self.runner.invoke(app, ["--check", str(py_file)])
-            assert result.exit_code == 0
-            assert "All docstrings are valid" in clean(result.output)
-
-            py_file.unlink(missing_ok=True)
+        assert _format_error_messages(error_message) == expected
 
     def test_36_output_list_format(self) -> None:
         """
         Test that --output=list shows compact list format.
         """
-        with tempfile.TemporaryDirectory() as temp_dir:
-            temp_path = Path(temp_dir)
-            py_file: Path = temp_path.joinpath("test.py")
-            py_file.write_text("def func(): pass")  # Missing docstring
-
-            result: Result = self.runner.invoke(app, ["--output=list", str(py_file)])
-            assert result.exit_code == 1  # Should exit with error when docstring errors found
-            output = clean(result.output)
-            # List format should not contain table headers
-            assert "File" not in output or "┃" not in output
-            # But should contain the file path and error details
-            assert "test.py" in output
-
-            py_file.unlink(missing_ok=True)
-
-    def test_37_output_table_format(self) -> None:
-        """
-        Test that --output=table shows detailed table format.
-        """
-        with tempfile.TemporaryDirectory() as temp_dir:
-            temp_path = Path(temp_dir)
-            py_file: Path = temp_path.joinpath("test.py")
-            py_file.write_text("def func(): pass")  # Missing docstring
-
-            result: Result = self.runner.invoke(app, ["--output=table", str(py_file)])
-            assert result.exit_code == 1  # Should exit with error when docstring errors found
-            output = clean(result.output)
-            # Table format should contain table headers and structure
-            assert "File" in output and "Line" in output and "Item" in output
-            # Check for table borders - accept various formats (unicode, ascii, or other)
-            assert any(char in output for char in ["┃", "|", "│", "╎", "┆", "┊"])
-
-            py_file.unlink(missing_ok=True)
-
-    def test_38_output_short_alias(self) -> None:
-        """
-        Test that -o is an alias for --output.
-        """
-        with tempfile.TemporaryDirectory() as temp_dir:
-            temp_path = Path(temp_dir)
-            py_file: Path = temp_path.joinpath("test.py")
-            py_file.write_text("def func(): pass")  # Missing docstring
-
-            result: Result = self.runner.invoke(app, ["-o", "table", str(py_file)])
-            assert result.exit_code == 1  # Should exit with error when docstring errors found
-            output = clean(result.output)
-            # Should show table format
-            assert "File" in output and "Line" in output and "Item" in output
-
-            py_file.unlink(missing_ok=True)
+        exit_code, output = self._check([str(self.bad_py)], output="list")
+        assert exit_code == 1  # Should exit with error when docstring errors found
+        # List format should not contain table headers
+        assert "File" not in output or "┃" not in output
+        # But should contain the file path and error details
+        assert self.bad_py.name in output
 
     def test_39_quiet_with_check_flag(self) -> None:
         """
-        Test that --quiet --check shows minimal output but still exits with error.
-        """
-        with tempfile.TemporaryDirectory() as temp_dir:
-            temp_path = Path(temp_dir)
-            py_file: Path = temp_path.joinpath("test.py")
-            py_file.write_text("def func(): pass")  # Missing docstring
-
-            result: Result = self.runner.invoke(app, ["--quiet", "--check", str(py_file)])
-            assert result.exit_code == 1
-            output = clean(result.output)
-            # Should show error count but not detailed errors
-            assert "error(s)" in output.lower()
-            # Should be minimal output
-            assert len(output.split("\n")) < 5
-
-            py_file.unlink(missing_ok=True)
-
-    def test_40_quiet_success_case(self) -> None:
-        """
-        Test that --quiet shows no output on success.
-        """
-        with tempfile.TemporaryDirectory() as temp_dir:
-            temp_path = Path(temp_dir)
-            py_file: Path = temp_path.joinpath("test.py")
-            py_file.write_text(
-                dedent(
-                    '''
-                    def good_function() -> None:
-                        """
-                        !!! note "Summary"
-                            This function has a good docstring.
-                        """
-                        pass
-                    '''
-                ).strip()
-            )
-
-            result: Result = self.runner.invoke(app, ["--quiet", str(py_file)])
-            assert result.exit_code == 0
-            assert clean(result.output).strip() == ""
-
-            py_file.unlink(missing_ok=True)
-
-    def test_41_check_flag_short_alias(self) -> None:
-        """
-        Test that -c works as short alias for --check.
-        """
-        with tempfile.NamedTemporaryFile(mode="w", suffix=".py", delete=False) as f:
-            f.write(
-                dedent(
-                    """
-                    def bad_function():
-                        pass
-                    """
-                ).strip()
-            )
-            f.flush()
-            temp_file_name = f.name
-
-        py_file = Path(temp_file_name)
-
-        try:
-            result: Result = self.runner.invoke(app, ["-c", str(py_file)])
-            assert result.exit_code == 1  # Should exit with error when -c is used and issues found
-            assert "Found" in clean(result.output)
-        finally:
-            py_file.unlink(missing_ok=True)
+        Test that quiet check mode shows minimal output but still exits with error.
+        """
+        results: dict[str, list[DocstringError]] = {
+            "test.py": [
+                DocstringError(
+                    file_path="test.py",
+                    line_number=1,
+                    item_name="test_function",
+                    item_type="function",
+                    message="Missing docstring",
+                )
+            ]
+        }
+        buffer = io.StringIO()
+        with redirect_stdout(buffer):
+            exit_code: int = _display_results(results, quiet=True, output="list", check=True)
+        assert exit_code == 1
+        output: str = buffer.getvalue()
+        # Should show error count but not detailed errors
+        assert "error(s)" in output.lower()
+        assert "Missing docstring" not in output
+        # Should be minimal output
+        assert len(output.split("\n")) < 5
 
     def test_42_config_flag_short_alias(self) -> None:
         """
         Test that -f works as short alias for --config.
         """
-        with tempfile.NamedTemporaryFile(mode="w", suffix=".py", delete=False) as f:
-            f.write(
-                dedent(
-                    """
-                    def good_function():
-                        '''
-                        !!! note "Summary"
-                            A good function.
-
-                        Params:
-                            None.
-
-                        Returns:
-                            (None): Nothing.
-                        '''
-                        pass
-                    """
-                ).strip()
-            )
-            f.flush()
-            temp_file_name = f.name
-
-        py_file = Path(temp_file_name)
-
-        try:
-            # Test -f works the same as --config
-            result: Result = self.runner.invoke(app, ["-f", "pyproject.toml", str(py_file)])
-            assert result.exit_code == 0
-        finally:
-            py_file.unlink(missing_ok=True)
+        # Test -f works the same as --config
+        assert self._exit_code(["-f", "pyproject.toml", str(self.fixtures["project_style"])]) == 0
 
     def test_43_example_callback_invalid_value(self) -> None:
         """
         Test example callback with invalid value.
         """
-        result: Result = self.runner.invoke(app, ["--example=invalid"])
-        assert result.exit_code == 1
-        assert "Invalid example type 'invalid'" in clean(result.output)
-        assert "Use 'config' or 'usage'" in clean(result.output)
-
-    def test_44_config_loading_exception(self) -> None:
-        """
-        Test config loading exception handling.
-        """
-        with tempfile.NamedTemporaryFile(mode="w", suffix=".py", delete=False) as f:
-            f.write("def func(): pass")
-            f.flush()
-            temp_file_name = f.name
-
-        py_file = Path(temp_file_name)
-
-        try:
-            # Mock load_config to raise an exception
-            with patch("docstring_format_checker.cli.load_config") as mock_load_config:
-                mock_load_config.side_effect = Exception("Test config error")
-
-                result: Result = self.runner.invoke(app, [str(py_file)])
-                assert result.exit_code == 1
-                assert "Error loading configuration: Test config error" in clean(result.output)
-        finally:
-            py_file.unlink(missing_ok=True)
-
-    def test_45_no_path_shows_help(self) -> None:
-        """
-        Test that no path argument shows help.
-        """
-        # Invoke with no path argument
-        result: Result = self.runner.invoke(app, [])
-        assert result.exit_code == 0
-        # More flexible check for the description that handles line wrapping
+        result: Result = self.runner.invoke(self.cli, ["--example=invalid"])
         output: str = clean(result.output)
-        assert all(
-            word in output
-            for word in "A CLI tool to check and validate Python docstring formatting and completeness".split(" ")
-        )
-
-    def test_46_invalid_output_format(self) -> None:
-        """
-        Test invalid output format error.
-        """
-        with tempfile.NamedTemporaryFile(mode="w", suffix=".py", delete=False) as f:
-            f.write("def func(): pass")
-            f.flush()
-            temp_file_name = f.name
-
-        py_file = Path(temp_file_name)
-
-        try:
-            result: Result = self.runner.invoke(app, ["--output=invalid", str(py_file)])
-            assert result.exit_code == 1
-            assert "Invalid output format 'invalid'" in clean(result.output)
-            assert "Use 'table' or 'list'" in clean(result.output)
-        finally:
-            py_file.unlink(missing_ok=True)
+        assert result.exit_code == 1
+        assert "Invalid example type 'invalid'" in output
+        assert "Use 'config' or 'usage'" in output
+
+    @parameterized.expand(
+        input=[
+            ("generic_exception", Exception("Test config error")),
+            ("value_error", ValueError("Mock config error")),
+        ],
+        name_func=name_func_predefined_name,
+    )
+    def test_44_config_loading_exception(self, name: str, error: Exception) -> None:
+        """
+        Test that exceptions raised while loading the config are reported and exit with an error.
+        """
+        # Mock load_config to raise an exception - need to patch where it's imported
+        with patch("docstring_format_checker.cli.load_config", side_effect=error):
+            result: Result = self.runner.invoke(self.cli, [str(self.bad_py)])
+        assert result.exit_code == 1
+        assert f"Error loading configuration: {error}" in result.output
 
     def test_47_auto_config_discovery_no_config_found(self) -> None:
         """
@@ -1017,43 +774,17 @@ class TestCLI(TestCase):
         """
 
         # Create a temporary directory without any pyproject.toml
-        with tempfile.TemporaryDirectory() as temp_dir:
-            temp_path = Path(temp_dir)
-
-            # Create a Python file in the temp directory with proper default config format
-            py_file: Path = temp_path.joinpath("test_file.py")
-            py_file.write_text(
-                dedent(
-                    '''
-                    def example_function():
-                        """!!! note "Summary"
-                        A simple function.
-
-                        Params:
-                            None
-
-                        Returns:
-                            None
-                        """
-                        pass
-                    '''
-                )
-            )
 
-            # Change to the temp directory to ensure no config is found
-            original_cwd: Path = Path.cwd()
-            try:
-                os.chdir(temp_path)
-                result: Result = self.runner.invoke(app, [str(py_file)])
-                # Should succeed with default config (exit code 0)
-                assert result.exit_code == 0
-                assert (
-                    "0 error" in result.output
-                    or "✅ All docstrings are valid!" in result.output
-                    or "All docstrings are valid" in result.output
-                )
-            finally:
-                os.chdir(original_cwd)
+        # Create a Python file in the temp directory with proper default config format
+        py_file: Path = self.temp_path.joinpath("test_file.py")
+        py_file.write_text(SUMMARY_ON_FIRST_LINE_FUNC_SRC)
+
+        # Point the current directory at the temp directory so no config is found
+        with patch.object(Path, "cwd", return_value=self.temp_path):
+            result: Result = self.runner.invoke(self.cli, [str(py_file)], catch_exceptions=False)
+        # Should succeed with default config (exit code 0)
+        assert result.exit_code == 0
+        assert "All docstrings are valid!" in result.output
 
     def test_48_auto_config_discovery_with_found_config(self) -> None:
         """
@@ -1062,433 +793,121 @@ class TestCLI(TestCase):
         """
 
         # Create a temporary directory with a pyproject.toml
-        with tempfile.TemporaryDirectory() as temp_dir:
-            temp_path = Path(temp_dir)
-
-            # Create a pyproject.toml file with simple content
-            config_file: Path = temp_path.joinpath("pyproject.toml")
-            config_content: str = dedent(
-                """
-                [tool.docstring-format-checker]
-                sections = [
-                    {name = "Summary", required = true, order = 1, type = "free_text"}
-                ]
-                """
-            )
-            config_file.write_text(config_content)
-
-            # Create a Python file in the temp directory
-            py_file: Path = temp_path.joinpath("test_file.py")
-            py_file.write_text(
-                dedent(
-                    '''
-                    def example_function():
-                        """A simple function."""
-                        pass
-                    '''
-                )
-            )
 
-            # Change to the temp directory so the config is auto-discovered
-            original_cwd: Path = Path.cwd()
-            try:
-                os.chdir(temp_path)
-                result: Result = self.runner.invoke(app, [str(py_file)])
-                # This test is mainly to cover the auto-discovery code path
-                # We don't care about the exit code as much as exercising the coverage
-                # The key is that find_config_file() finds the config and load_config(found_config) is called
-                assert result.exit_code in [0, 1]  # Either success or validation failure is acceptable
-                # If there's output, it means the code ran (which is what we want for coverage)
-                assert len(result.output) > 0
-            finally:
-                os.chdir(original_cwd)
-
-    def test_49_config_loading_exception_handling(self) -> None:
-        """
-        Test that config loading exceptions are handled properly.
-        """
-        with tempfile.NamedTemporaryFile(mode="w", suffix=".py", delete=False) as f:
-            f.write("def func(): pass")
-            f.flush()
-            temp_file_name = f.name
-
-        py_file = Path(temp_file_name)
-
-        try:
-            # Mock load_config to raise an exception - need to patch where it's imported
-            with patch("docstring_format_checker.cli.load_config", side_effect=ValueError("Mock config error")):
-                result: Result = self.runner.invoke(app, [str(py_file)])
-                assert result.exit_code == 1
-                assert "Error loading configuration: Mock config error" in clean(result.output)
-        finally:
-            py_file.unlink(missing_ok=True)
+        # Create a pyproject.toml file with simple content
+        config_file: Path = self.temp_path.joinpath("pyproject.toml")
+        config_file.write_text(ALT_TABLE_CONFIG_TOML)
+
+        # Create a Python file in the temp directory
+        py_file: Path = self.temp_path.joinpath("test_file.py")
+        py_file.write_text(ONE_LINE_DOCSTRING_SRC)
+
+        # The search starts from the target file's directory, so the config is auto-discovered
+        result: Result = self.runner.invoke(self.cli, [str(py_file)])
+        # This test is mainly to cover the auto-discovery code path
+        # We don't care about the exit code as much as exercising the coverage
+        # The key is that find_config_file() finds the config and load_config(found_config) is called
+        assert result.exit_code in [0, 1]  # Either success or validation failure is acceptable
+        # If there's output, it means the code ran (which is what we want for coverage)
+        assert len(result.output) > 0
 
     def test_50_compound_errors_with_no_line_number(self) -> None:
-        """Test list output with compound errors where line_number is 0 to hit cli.py:451."""
-
-        with tempfile.NamedTemporaryFile(mode="w+", suffix=".py", delete=False) as test_file:
-            test_file.write(
-                dedent(
-                    '''
-                def test_function():
-                    """Summary here."""
-                    pass
-                '''
-                ).strip()
-            )
-            test_file.flush()
-            temp_file_name = test_file.name
-
-        try:
-            # Mock the check_file method to return an error with line_number = 0 and compound message
-            def mock_check_file(self, file_path):
-                return [
-                    DocstringError(
-                        file_path=str(file_path),
-                        line_number=0,  # This should trigger line 451 in cli.py
-                        item_type="function",
-                        item_name="test_function",
-                        message="Missing required section 'params'; Missing required section 'returns'",
-                    )
-                ]
-
-            # Patch the method
-            with patch.object(DocstringChecker, "check_file", mock_check_file):
-                result = self.runner.invoke(app, ["-o", "list", temp_file_name])
-
-            # The test should succeed and hit the specific line we're targeting
-            assert result.exit_code == 1  # Should be 1 for validation errors
-            assert "Missing required section" in result.output
-
-        finally:
-            Path(temp_file_name).unlink(missing_ok=True)
+        """Test list output with compound errors where line_number is 0."""
+
+        error = DocstringError(
+            file_path="test.py",
+            line_number=0,
+            item_type="function",
+            item_name="test_function",
+            message="Missing required section 'params'; Missing required section 'returns'",
+        )
+
+        lines: list[str] = _format_error_output(error)
+        # Header should fall back to a generic 'Error' label, then one bullet per compound message
+        assert len(lines) == 3
+        assert "Error" in lines[0] and "Line" not in lines[0]
+        assert lines[1] == "    - Missing required section 'params'"
+        assert lines[2] == "    - Missing required section 'returns'"
 
     def test_51_multiple_files_success(self) -> None:
         """
         Test checking multiple valid files succeeds.
         """
-        # Create two temporary files with valid docstrings
-        temp_file1_name: str = ""
-        temp_file2_name: str = ""
-
-        try:
-            # Create first file
-            with tempfile.NamedTemporaryFile(mode="w", suffix=".py", delete=False) as temp_file1:
-                temp_file1.write(
-                    dedent(
-                        '''
-                        def example_function():
-                            """
-                            !!! note "Summary"
-                                This is a valid example function.
-                            """
-                            pass
-                        '''
-                    ).strip()
-                )
-                temp_file1_name = temp_file1.name
-
-            # Create second file
-            with tempfile.NamedTemporaryFile(mode="w", suffix=".py", delete=False) as temp_file2:
-                temp_file2.write(
-                    dedent(
-                        '''
-                        def another_function():
-                            """
-                            !!! note "Summary"
-                                This is another valid example function.
-                            """
-                            pass
-                        '''
-                    ).strip()
-                )
-                temp_file2_name = temp_file2.name
-
-            result: Result = self.runner.invoke(app, [temp_file1_name, temp_file2_name])
-            assert result.exit_code == 0
-            assert "All docstrings are valid!" in clean(result.output)
 
-        finally:
-            Path(temp_file1_name).unlink(missing_ok=True)
-            Path(temp_file2_name).unlink(missing_ok=True)
+        exit_code, output = self._check([str(self.good_py), str(self.other_good_py)])
+        assert exit_code == 0
+        assert "All docstrings are valid!" in output
 
     def test_52_multiple_files_with_errors(self) -> None:
         """
         Test checking multiple files where some have errors.
         """
-        temp_file1_name: str = ""
-        temp_file2_name: str = ""
-
-        try:
-            # Create first file with valid docstring
-            with tempfile.NamedTemporaryFile(mode="w", suffix=".py", delete=False) as temp_file1:
-                temp_file1.write(
-                    dedent(
-                        '''
-                        def valid_function():
-                            """
-                            !!! note "Summary"
-                                This is a valid function.
-                            """
-                            pass
-                        '''
-                    ).strip()
-                )
-                temp_file1_name = temp_file1.name
-
-            # Create second file with invalid docstring
-            with tempfile.NamedTemporaryFile(mode="w", suffix=".py", delete=False) as temp_file2:
-                temp_file2.write(
-                    dedent(
-                        '''
-                        def invalid_function():
-                            """
-                            This is missing the required admonition.
-                            """
-                            pass
-                        '''
-                    ).strip()
-                )
-                temp_file2_name = temp_file2.name
-
-            result: Result = self.runner.invoke(app, [temp_file1_name, temp_file2_name])
-            assert result.exit_code == 1
-            assert "Missing required section: 'summary'" in clean(result.output)
-
-        finally:
-            Path(temp_file1_name).unlink(missing_ok=True)
-            Path(temp_file2_name).unlink(missing_ok=True)
+        # Pair the shared valid file with a file that has an invalid docstring
+        exit_code, output = self._check([str(self.good_py), str(self.fixtures["missing_summary"])])
+        assert exit_code == 1
+        assert "Missing required section: 'summary'" in output
 
     def test_53_multiple_files_with_check_flag(self) -> None:
         """
         Test multiple files with --check flag exits with proper code.
         """
-        temp_file1_name: str = ""
-        temp_file2_name: str = ""
-
-        try:
-            # Create two files with valid docstrings
-            with tempfile.NamedTemporaryFile(mode="w", suffix=".py", delete=False) as temp_file1:
-                temp_file1.write(
-                    dedent(
-                        '''
-                        def function_one():
-                            """
-                            !!! note "Summary"
-                                First function.
-                            """
-                            pass
-                        '''
-                    ).strip()
-                )
-                temp_file1_name = temp_file1.name
-
-            with tempfile.NamedTemporaryFile(mode="w", suffix=".py", delete=False) as temp_file2:
-                temp_file2.write(
-                    dedent(
-                        '''
-                        def function_two():
-                            """
-                            !!! note "Summary"
-                                Second function.
-                            """
-                            pass
-                        '''
-                    ).strip()
-                )
-                temp_file2_name = temp_file2.name
 
-            result: Result = self.runner.invoke(app, ["--check", temp_file1_name, temp_file2_name])
-            assert result.exit_code == 0
-            assert "All docstrings are valid!" in clean(result.output)
-
-        finally:
-            Path(temp_file1_name).unlink(missing_ok=True)
-            Path(temp_file2_name).unlink(missing_ok=True)
+        result: Result = self.runner.invoke(
+            self.cli, ["--check", str(self.good_py), str(self.other_good_py)], catch_exceptions=False
+        )
+        assert result.exit_code == 0
+        assert "All docstrings are valid!" in result.output
 
     def test_54_multiple_files_nonexistent_path(self) -> None:
         """
         Test multiple files where one path doesn't exist.
         """
-        temp_file_name: str = ""
-
-        try:
-            # Create one valid file
-            with tempfile.NamedTemporaryFile(mode="w", suffix=".py", delete=False) as temp_file:
-                temp_file.write(
-                    dedent(
-                        '''
-                        def valid_function():
-                            """
-                            !!! note "Summary"
-                                This is a valid function.
-                            """
-                            pass
-                        '''
-                    ).strip()
-                )
-                temp_file_name = temp_file.name
-
-            # Include a nonexistent file
-            result: Result = self.runner.invoke(app, [temp_file_name, "nonexistent_file.py"])
-            assert result.exit_code == 1
-            assert "Error: Paths do not exist" in clean(result.output)
-            assert "nonexistent_file.py" in clean(result.output)
-
-        finally:
-            Path(temp_file_name).unlink(missing_ok=True)
+        # Include a nonexistent file alongside the shared valid file
+        exit_code, output = self._check([str(self.good_py), "nonexistent_file.py"])
+        assert exit_code == 1
+        assert "Error: Paths do not exist" in output
+        assert "nonexistent_file.py" in output
 
     def test_55_multiple_files_mixed_types(self) -> None:
         """
         Test multiple paths with mix of files and directories.
         """
-        temp_file_name: str = ""
-        temp_dir_name: str = ""
-
-        try:
-            # Create a temporary file
-            with tempfile.NamedTemporaryFile(mode="w", suffix=".py", delete=False) as temp_file:
-                temp_file.write(
-                    dedent(
-                        '''
-                        def file_function():
-                            """
-                            !!! note "Summary"
-                                Function in a file.
-                            """
-                            pass
-                        '''
-                    ).strip()
-                )
-                temp_file_name = temp_file.name
-
-            # Create a temporary directory with a Python file
-
-            temp_dir = tempfile.mkdtemp()
-            temp_dir_name = temp_dir
-
-            dir_file_path = Path(temp_dir) / "dir_file.py"
-            dir_file_path.write_text(
-                dedent(
-                    '''
-                    def dir_function():
-                        """
-                        !!! note "Summary"
-                            Function in a directory.
-                        """
-                        pass
-                    '''
-                ).strip()
-            )
-
-            result: Result = self.runner.invoke(app, [temp_file_name, temp_dir_name])
-            assert result.exit_code == 0
-            assert "All docstrings are valid!" in clean(result.output)
+        # Create a temporary directory with a Python file
+        sub_dir: Path = self.temp_path.joinpath("subdir")
+        sub_dir.mkdir()
+        dir_file_path: Path = sub_dir.joinpath("dir_file.py")
+        dir_file_path.write_text(GOOD_FUNC_SRC)
 
-        finally:
-            Path(temp_file_name).unlink(missing_ok=True)
-            if temp_dir_name:
-
-                shutil.rmtree(temp_dir_name, ignore_errors=True)
+        exit_code, output = self._check([str(self.good_py), str(sub_dir)])
+        assert exit_code == 0
+        assert "All docstrings are valid!" in output
 
     def test_56_multiple_files_table_output(self) -> None:
         """
         Test multiple files with table output format.
         """
-        temp_file1_name: str = ""
-        temp_file2_name: str = ""
-
-        try:
-            # Create files with valid docstrings
-            with tempfile.NamedTemporaryFile(mode="w", suffix=".py", delete=False) as temp_file1:
-                temp_file1.write(
-                    dedent(
-                        '''
-                        def function_one():
-                            """
-                            !!! note "Summary"
-                                First function.
-                            """
-                            pass
-                        '''
-                    ).strip()
-                )
-                temp_file1_name = temp_file1.name
-
-            with tempfile.NamedTemporaryFile(mode="w", suffix=".py", delete=False) as temp_file2:
-                temp_file2.write(
-                    dedent(
-                        '''
-                        def function_two():
-                            """
-                            !!! note "Summary"
-                                Second function.
-                            """
-                            pass
-                        '''
-                    ).strip()
-                )
-                temp_file2_name = temp_file2.name
-
-            result: Result = self.runner.invoke(app, ["--output=table", temp_file1_name, temp_file2_name])
-            assert result.exit_code == 0
-            assert "All docstrings are valid!" in clean(result.output)
 
-        finally:
-            Path(temp_file1_name).unlink(missing_ok=True)
-            Path(temp_file2_name).unlink(missing_ok=True)
+        result: Result = self.runner.invoke(
+            self.cli, ["--output=table", str(self.good_py), str(self.other_good_py)], catch_exceptions=False
+        )
+        assert result.exit_code == 0
+        assert "All docstrings are valid!" in result.output
 
     def test_57_multiple_files_quiet_mode(self) -> None:
         """
         Test multiple files with quiet mode.
         """
-        temp_file1_name: str = ""
-        temp_file2_name: str = ""
-
-        try:
-            # Create files with valid docstrings
-            with tempfile.NamedTemporaryFile(mode="w", suffix=".py", delete=False) as temp_file1:
-                temp_file1.write(
-                    dedent(
-                        '''
-                        def function_one():
-                            """
-                            !!! note "Summary"
-                                First function.
-                            """
-                            pass
-                        '''
-                    ).strip()
-                )
-                temp_file1_name = temp_file1.name
-
-            with tempfile.NamedTemporaryFile(mode="w", suffix=".py", delete=False) as temp_file2:
-                temp_file2.write(
-                    dedent(
-                        '''
-                        def function_two():
-                            """
-                            !!! note "Summary"
-                                Second function.
-                            """
-                            pass
-                        '''
-                    ).strip()
-                )
-                temp_file2_name = temp_file2.name
 
-            result: Result = self.runner.invoke(app, ["--quiet", temp_file1_name, temp_file2_name])
-            assert result.exit_code == 0
-
-            # In quiet mode with success, should show minimal output (might be empty or just warnings)
-            # The important thing is that it doesn't show detailed errors
-            output: str = clean(result.output)
-            # Should not contain detailed error information
-            assert "Missing required section" not in output
+        result: Result = self.runner.invoke(
+            self.cli, ["--quiet", str(self.good_py), str(self.other_good_py)], catch_exceptions=False
+        )
+        assert result.exit_code == 0
 
-        finally:
-            Path(temp_file1_name).unlink(missing_ok=True)
-            Path(temp_file2_name).unlink(missing_ok=True)
+        # In quiet mode with success, should show minimal output (might be empty or just warnings)
+        # The important thing is that it doesn't show detailed errors
+        output: str = result.output
+        # Should not contain detailed error information
+        assert "Missing required section" not in output
 
     def test_58_format_error_output_single_line(self) -> None:
         """
@@ -1529,3 +948,35 @@ class TestCLI(TestCase):
         assert "    - First line of error" in lines[1]
         assert "    Second line of error" in lines[2]
         assert "    Third line" in lines[3]
+
+    @parameterized.expand(
+        input=[
+            ("nonexistent_file", ["nonexistent.py"], 1, ["Error: Paths do not exist"]),
+            ("nonexistent_config", ["--config", "nonexistent.toml", "{bad}"], 1, ["Configuration file does not exist"]),
+            ("quiet_single_error", ["--quiet", "{bad}"], 1, ["1 error(s) in 1 function over 1 file"]),
+            ("check_flag_with_errors", ["--check", "{bad}"], 1, ["error"]),
+            ("check_flag_without_errors", ["--check", "{good}"], 0, ["All docstrings are valid"]),
+            ("check_flag_short_alias", ["-c", "{bad}"], 1, ["Found"]),
+            ("output_table_format", ["--output=table", "{bad}"], 1, ["File", "Line", "Item", "┃"]),
+            ("output_short_alias", ["-o", "table", "{bad}"], 1, ["File", "Line", "Item", "┃"]),
+            (
+                "invalid_output_format",
+                ["--output=invalid", "{bad}"],
+                1,
+                ["Invalid output format 'invalid'", "Use 'table' or 'list'"],
+            ),
+        ],
+        name_func=name_func_predefined_name,
+    )
+    def test_61_cli_exit_code_and_output(
+        self, name: str, args: list[str], expected_code: int, expected_substrings: list[str]
+    ) -> None:
+        """
+        Test that CLI invocations on the shared fixture files exit with the expected code and message.
+        """
+        args = [arg.format(good=self.good_py, bad=self.bad_py) for arg in args]
+        result: Result = self.runner.invoke(self.cli, args)
+        output: str = result.output
+        assert result.exit_code == expected_code
+        for substring in expected_substrings:
+            assert substring in output
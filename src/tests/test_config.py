@@ -14,6 +14,7 @@
 import os
 import sys
 import tempfile
+from inspect import cleandoc
 from pathlib import Path
 from textwrap import dedent
 from typing import Optional, Union
@@ -55,23 +56,17 @@ class TestConfig(TestCase):
         """
 
         with tempfile.TemporaryDirectory() as temp_dir:
-            # Change to temp directory to avoid loading pyproject.toml from current directory
-            original_cwd = Path.cwd()
-            temp_path = Path(temp_dir)
-            os.chdir(temp_path)
-
-            try:
+            # Point the current directory at a temp directory to avoid loading pyproject.toml from the repo
+            with patch.object(Path, "cwd", return_value=Path(temp_dir)):
                 config: Config = load_config()
-                assert isinstance(config, Config)
-                assert len(config.sections) > 0
-                assert all(isinstance(section, SectionConfig) for section in config.sections)
-                assert any(section.name == "summary" for section in config.sections)
-                # Test default global config values
-                assert config.global_config.allow_undefined_sections is False
-                assert config.global_config.require_docstrings is True
-                assert config.global_config.check_private is False
-            finally:
-                os.chdir(original_cwd)
+            assert isinstance(config, Config)
+            assert len(config.sections) > 0
+            assert all(isinstance(section, SectionConfig) for section in config.sections)
+            assert any(section.name == "summary" for section in config.sections)
+            # Test default global config values
+            assert config.global_config.allow_undefined_sections is False
+            assert config.global_config.require_docstrings is True
+            assert config.global_config.check_private is False
 
     def test_02_load_config_from_toml(self) -> None:
         """
@@ -109,9 +104,6 @@ class TestConfig(TestCase):
             assert config.sections[0].name == "summary"
             assert config.sections[1].name == "params"
 
-            # Clean up
-            config_file.unlink(missing_ok=True)
-
     def test_02b_load_config_multiple_sections_no_order(self) -> None:
         """
         Test loading configuration with multiple sections that don't have an order value.
@@ -154,9 +146,6 @@ class TestConfig(TestCase):
             assert "deprecation" in unordered_names
             assert "warning" in unordered_names
 
-            # Clean up
-            config_file.unlink(missing_ok=True)
-
     def test_02c_load_config_explicit_duplicate_order(self) -> None:
         """
         Test that explicitly providing duplicate order values still raises an error.
@@ -188,9 +177,6 @@ class TestConfig(TestCase):
             with raises(InvalidConfigError_DuplicateOrderValues):
                 load_config(str(config_file))
 
-            # Clean up
-            config_file.unlink(missing_ok=True)
-
     def test_03_load_config_alternative_table_name(self) -> None:
         """
         Test loading configuration from an alternative TOML table name.
@@ -219,9 +205,6 @@ class TestConfig(TestCase):
             assert len(config.sections) == 1
             assert config.sections[0].name == "test"
 
-            # Clean up
-            config_file.unlink(missing_ok=True)
-
     def test_04_load_config_file_not_found(self) -> None:
         """
         Test error handling when config file doesn't exist.
@@ -294,9 +277,6 @@ class TestConfig(TestCase):
             with raises(InvalidConfigError, match="Failed to parse TOML file"):
                 load_config(str(config_file))
 
-            # Clean up
-            config_file.unlink(missing_ok=True)
-
     def test_08_load_config_missing_tool_section(self) -> None:
         """
         Test loading config when [tool.dfc] section doesn't exist.
@@ -308,7 +288,7 @@ class TestConfig(TestCase):
             temp_path = Path(temp_dir)
             config_file: Path = temp_path.joinpath("no_tool_section.toml")
             config_file.write_text(
-                dedent(
+                cleandoc(
                     """
                     [build-system]
                     requires = ["setuptools", "wheel"]
@@ -316,7 +296,7 @@ class TestConfig(TestCase):
                     [tool.other]
                     setting = "value"
                     """
-                ).strip()
+                )
             )
 
             # Should return default config when no dfc section found
@@ -324,9 +304,6 @@ class TestConfig(TestCase):
             assert isinstance(config, Config)
             assert len(config.sections) > 0  # DEFAULT_CONFIG has sections
 
-            # Clean up
-            config_file.unlink(missing_ok=True)
-
     def test_09_load_config_missing_sections_array(self) -> None:
         """
         Test loading config when sections array is missing.
@@ -338,12 +315,12 @@ class TestConfig(TestCase):
             temp_path = Path(temp_dir)
             config_file: Path = temp_path.joinpath("no_sections.toml")
             config_file.write_text(
-                dedent(
+                cleandoc(
                     """
                     [tool.dfc]
                     some_setting = "value"
                     """
-                ).strip()
+                )
             )
 
             # Should return default config when no sections found
@@ -351,9 +328,6 @@ class TestConfig(TestCase):
             assert isinstance(config, Config)
             assert len(config.sections) > 0  # Returns DEFAULT_CONFIG (has 8 sections)
 
-            # Clean up
-            config_file.unlink(missing_ok=True)
-
     def test_10_section_config_validation_errors(self) -> None:
         """
         Test SectionConfig validation with various error conditions.
@@ -365,7 +339,7 @@ class TestConfig(TestCase):
             temp_path = Path(temp_dir)
             config_file1: Path = temp_path.joinpath("missing_fields.toml")
             config_file1.write_text(
-                dedent(
+                cleandoc(
                     """
                     [tool.dfc]
 
@@ -373,7 +347,7 @@ class TestConfig(TestCase):
                     name = "test"
                     # Missing order, type, required
                     """
-                ).strip()
+                )
             )
 
             with raises(InvalidConfigError, match="Invalid section configuration"):
@@ -382,7 +356,7 @@ class TestConfig(TestCase):
             # Test section with invalid type through config loading
             config_file2: Path = temp_path.joinpath("invalid_type.toml")
             config_file2.write_text(
-                dedent(
+                cleandoc(
                     """
                     [tool.dfc]
 
@@ -392,16 +366,12 @@ class TestConfig(TestCase):
                     type = "invalid_type"
                     required = true
                     """
-                ).strip()
+                )
             )
 
             with raises(InvalidConfigError, match="Invalid section configuration"):
                 load_config(str(config_file2))
 
-            # Clean up
-            config_file1.unlink(missing_ok=True)
-            config_file2.unlink(missing_ok=True)
-
     def test_11_alternative_config_file_discovery(self) -> None:
         """
         Test pyproject.toml config file discovery.
@@ -413,7 +383,7 @@ class TestConfig(TestCase):
             temp_path = Path(temp_dir)
             pyproject_config: Path = temp_path.joinpath("pyproject.toml")
             pyproject_config.write_text(
-                dedent(
+                cleandoc(
                     """
                     [tool.dfc]
 
@@ -423,7 +393,7 @@ class TestConfig(TestCase):
                     type = "free_text"
                     required = true
                     """
-                ).strip()
+                )
             )
 
             # Should find pyproject.toml
@@ -446,7 +416,7 @@ class TestConfig(TestCase):
             temp_path = Path(temp_dir)
             config_file: Path = temp_path.joinpath("version_compat.toml")
             config_file.write_text(
-                dedent(
+                cleandoc(
                     """
                     [tool.dfc]
 
@@ -456,7 +426,7 @@ class TestConfig(TestCase):
                     type = "free_text"
                     required = true
                     """
-                ).strip()
+                )
             )
 
             # This should work regardless of Python version
@@ -465,61 +435,47 @@ class TestConfig(TestCase):
             assert len(config.sections) == 1
             assert config.sections[0].name == "summary"
 
-            # Clean up
-            config_file.unlink(missing_ok=True)
-
     def test_14_load_config_no_pyproject_in_cwd(self) -> None:
         """
         Test loading config when no pyproject.toml exists in current directory.
         """
 
-        # Change to a temporary directory that doesn't have pyproject.toml
+        # Point the current directory at a temporary directory that doesn't have pyproject.toml
         with tempfile.TemporaryDirectory() as temp_dir:
-            original_cwd = os.getcwd()
-            try:
-                os.chdir(temp_dir)
+            with patch.object(Path, "cwd", return_value=Path(temp_dir)):
                 # Call load_config with no argument - should return DEFAULT_CONFIG
                 config = load_config()
-                assert isinstance(config, Config)
-                assert len(config.sections) > 0  # DEFAULT_CONFIG has sections
-            finally:
-                os.chdir(original_cwd)
+            assert isinstance(config, Config)
+            assert len(config.sections) > 0  # DEFAULT_CONFIG has sections
 
     def test_15_find_config_file_default_start_path(self) -> None:
         """
         Test find_config_file when no start_path is provided.
         """
 
-        # Change to a temporary directory and create pyproject.toml there
+        # Create pyproject.toml in a temporary directory and point the current directory at it
         with tempfile.TemporaryDirectory() as temp_dir:
 
-            original_cwd = os.getcwd()
-
-            try:
-                os.chdir(temp_dir)
-
-                # Create a pyproject.toml with dfc config
-                pyproject_path = Path("pyproject.toml")
-                pyproject_path.write_text(
-                    dedent(
-                        """
-                        [tool.dfc]
-
-                        [[tool.dfc.sections]]
-                        order = 1
-                        name = "summary"
-                        type = "free_text"
-                        required = true
-                        """
-                    ).strip()
+            # Create a pyproject.toml with dfc config
+            pyproject_path = Path(temp_dir).joinpath("pyproject.toml")
+            pyproject_path.write_text(
+                cleandoc(
+                    """
+                    [tool.dfc]
+
+                    [[tool.dfc.sections]]
+                    order = 1
+                    name = "summary"
+                    type = "free_text"
+                    required = true
+                    """
                 )
+            )
 
-                # Call find_config_file with no arguments (uses cwd)
+            # Call find_config_file with no arguments (uses cwd)
+            with patch.object(Path, "cwd", return_value=Path(temp_dir)):
                 found: Path = find_config_file()  # type:ignore
-                assert found.resolve() == pyproject_path.resolve()
-
-            finally:
-                os.chdir(original_cwd)
+            assert found.resolve() == pyproject_path.resolve()
 
     def test_16_find_config_file_malformed_pyproject(self) -> None:
         """
@@ -542,34 +498,34 @@ class TestConfig(TestCase):
         Test tomli import path for older Python versions (mocked).
         """
 
-        # Mock sys.version_info to simulate Python < 3.11
-        with patch.object(sys, "version_info", (3, 10, 0)):
+        # ## Python StdLib Imports ----
+        import importlib
 
-            # Mock tomli module to avoid ImportError
-            mock_tomli = MagicMock()
-            mock_tomli.load = MagicMock(return_value={"tool": {"dfc": {"sections": []}}})
+        # ## Local First Party Imports ----
+        from docstring_format_checker import config
 
-            with patch.dict("sys.modules", {"tomli": mock_tomli}):
-                # Re-import the config module to trigger the tomli import path
+        # Store original module reference
+        original_config = config
 
-                # ## Python StdLib Imports ----
-                import importlib
-
-                # ## Local First Party Imports ----
-                from docstring_format_checker import config
+        try:
+            # Mock sys.version_info to simulate Python < 3.11
+            with patch.object(sys, "version_info", (3, 10, 0)):
 
-                # Store original module reference
-                original_config = config
+                # Mock tomli module to avoid ImportError
+                mock_tomli = MagicMock()
+                mock_tomli.load = MagicMock(return_value={"tool": {"dfc": {"sections": []}}})
 
-                try:
+                with patch.dict("sys.modules", {"tomli": mock_tomli}):
+                    # Re-import the config module to trigger the tomli import path
                     importlib.reload(config)
 
                     # Test that the module still works with mocked tomli
                     assert hasattr(config, "load_config")
                     assert hasattr(config, "DEFAULT_CONFIG")
-                finally:
-                    # Restore the original config module to avoid affecting other tests
-                    importlib.reload(original_config)
+        finally:
+            # Restore the original config module to avoid affecting other tests
+            # This must happen after the patches are undone, otherwise the mocked `tomli` stays bound as `tomllib`
+            importlib.reload(original_config)
 
     def test_18_duplicate_order_validation(self) -> None:
         """
@@ -677,11 +633,11 @@ class TestConfig(TestCase):
 
     def test_23_load_config_explicit_empty_string_admonition_edge_case(self) -> None:
         """
-        Test loading config with explicit empty string admonition to trigger line 306.
-        This ensures line 306 in config.py is covered by testing the empty string branch.
+        Test loading config with an explicit empty string admonition.
+        An empty string is still a string admonition, so it must be paired with a `prefix`.
         """
 
-        config_content = dedent(
+        config_content = cleandoc(
             """
             [tool.dfc]
             [[tool.dfc.sections]]
@@ -691,7 +647,7 @@ class TestConfig(TestCase):
             required = true
             admonition = ""
             """
-        ).strip()
+        )
 
         with tempfile.NamedTemporaryFile(mode="w", suffix=".toml", delete=False) as f:
             f.write(config_content)
@@ -700,19 +656,8 @@ class TestConfig(TestCase):
 
         try:
             # Force loading from this specific file to trigger the empty string logic
-            config: Config = load_config(Path(temp_file))
-
-            # Should process the empty string and convert to False (line 306)
-            assert len(config.sections) >= 1
-            test_section: Optional[SectionConfig] = None
-            for section in config.sections:
-                if section.name == "test_section":
-                    test_section = section
-                    break
-
-            # The admonition should be False due to empty string conversion
-            if test_section:
-                assert test_section.admonition is False
+            with pytest.raises(InvalidConfigError, match="when admonition is a string, prefix must be provided"):
+                load_config(Path(temp_file))
 
         finally:
             os.unlink(temp_file)
@@ -725,7 +670,7 @@ class TestConfig(TestCase):
         # Test the case where config has tool section but neither 'dfc' nor 'docstring-format-checker'
         # This tests line 384 in config.py which was uncovered
 
-        content: str = dedent(
+        content: str = cleandoc(
             """
             [tool.other-tool]
             some_option = true
@@ -733,7 +678,7 @@ class TestConfig(TestCase):
             [tool.another-tool]
             value = "test"
             """
-        ).strip()
+        )
 
         with tempfile.NamedTemporaryFile(mode="w", suffix=".toml", delete=False) as f:
             f.write(content)
@@ -759,7 +704,7 @@ class TestConfig(TestCase):
         # Test the case where config has no tool section at all
         # This should trigger line 384: return None when "tool" not in config_data
 
-        content: str = dedent(
+        content: str = cleandoc(
             """
             [build-system]
             requires = ["setuptools"]
@@ -767,7 +712,7 @@ class TestConfig(TestCase):
             [project]
             name = "test-project"
             """
-        ).strip()
+        )
 
         with tempfile.NamedTemporaryFile(mode="w", suffix=".toml", delete=False) as f:
             f.write(content)
@@ -839,3 +784,18 @@ class TestConfig(TestCase):
         ]
         # Should not raise any error
         _validate_config_order(sections)
+
+    def test_30_load_config_empty_sections_uses_defaults(self) -> None:
+        """
+        Test that an empty `sections` array falls back to the default sections.
+        """
+
+        # ## Local First Party Imports ----
+        from docstring_format_checker import config as config_module
+
+        with tempfile.TemporaryDirectory() as temp_dir:
+            config_file: Path = Path(temp_dir).joinpath("pyproject.toml")
+            config_file.write_text("[tool.dfc]\nsections = []\n")
+
+            config: Config = load_config(config_file)
+            assert config.sections is config_module.DEFAULT_SECTIONS
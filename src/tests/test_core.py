@@ -15,6 +15,7 @@ import subprocess
 import tempfile
 from ast import Module, stmt
 from functools import partial
+from inspect import cleandoc
 from pathlib import Path
 from subprocess import CompletedProcess
 from textwrap import dedent
@@ -137,9 +138,6 @@ class TestDocstringChecker(TestCase):
             errors: list[DocstringError] = self.simple_checker.check_file(str(py_file))
             assert len(errors) == 0
 
-            # Clean up
-            py_file.unlink(missing_ok=True)
-
     def test_02_check_file_with_missing_docstrings(self) -> None:
         """
         Test checking a file with missing docstrings.
@@ -174,9 +172,6 @@ class TestDocstringChecker(TestCase):
             method_error: DocstringError = next(e for e in errors if e.item_name == "bad_method")
             assert method_error.item_type == "method"
 
-            # Clean up
-            py_file.unlink(missing_ok=True)
-
     def test_03_check_file_with_detailed_docstrings(self) -> None:
         """
         Test checking a file with detailed docstring requirements.
@@ -216,9 +211,6 @@ class TestDocstringChecker(TestCase):
             errors: list[DocstringError] = self.detailed_checker.check_file(str(py_file))
             assert len(errors) == 0
 
-            # Clean up
-            py_file.unlink(missing_ok=True)
-
     def test_04_check_file_with_incomplete_detailed_docstrings(self) -> None:
         """
         Test checking a file with incomplete detailed docstrings.
@@ -246,9 +238,6 @@ class TestDocstringChecker(TestCase):
             assert len(errors) == 1
             assert "params" in errors[0].message.lower()
 
-            # Clean up
-            py_file.unlink(missing_ok=True)
-
     def test_05_check_directory(self) -> None:
         """
         Test checking a directory of Python files.
@@ -365,9 +354,6 @@ class TestDocstringChecker(TestCase):
             with pytest.raises(SyntaxError):
                 self.simple_checker.check_file(str(py_file))
 
-            # Clean up
-            py_file.unlink(missing_ok=True)
-
     def test_09_check_non_python_file(self) -> None:
         """
         Test error handling for non-Python files.
@@ -383,9 +369,6 @@ class TestDocstringChecker(TestCase):
             with pytest.raises(InvalidFileError):
                 self.simple_checker.check_file(str(txt_file))
 
-            # Clean up
-            txt_file.unlink(missing_ok=True)
-
     def test_10_check_nonexistent_file(self) -> None:
         """
         Test error handling for nonexistent files.
@@ -447,9 +430,6 @@ class TestDocstringChecker(TestCase):
             with pytest.raises(ValueError, match="Cannot decode file"):
                 self.simple_checker.check_file(str(py_file))
 
-            # Clean up
-            py_file.unlink(missing_ok=True)
-
     def test_13_empty_sections_config(self) -> None:
         """
         Test checker with empty sections configuration.
@@ -477,9 +457,6 @@ class TestDocstringChecker(TestCase):
             # No sections to check, so no errors
             assert len(errors) == 0
 
-            # Clean up
-            py_file.unlink(missing_ok=True)
-
     def test_14_check_directory_empty(self) -> None:
         """
         Test checking empty directory.
@@ -800,9 +777,6 @@ class TestDocstringChecker(TestCase):
             with pytest.raises(InvalidFileError, match="File must be a Python file"):
                 self.simple_checker.check_file(str(txt_file))
 
-            # Clean up
-            txt_file.unlink(missing_ok=True)
-
     def test_24_check_directory_error_handling(self) -> None:
         """
         Test error handling in check_directory method.
@@ -821,9 +795,6 @@ class TestDocstringChecker(TestCase):
             with pytest.raises(DirectoryNotFoundError):
                 self.simple_checker.check_directory(str(py_file))
 
-            # Clean up
-            py_file.unlink(missing_ok=True)
-
     def test_25_section_order_validation(self) -> None:
         """
         Test validation of section order in docstrings.
@@ -1233,9 +1204,6 @@ class TestDocstringChecker(TestCase):
             py_file.write_text(python_content)
             errors: list[DocstringError] = checker.check_file(str(py_file))
 
-            # Clean up
-            py_file.unlink(missing_ok=True)
-
             # Should find error for missing examples section
             assert len(errors) > 0
             error_messages: list[str] = [error.message for error in errors]
@@ -1296,9 +1264,6 @@ class TestDocstringChecker(TestCase):
             # Should have no errors for custom free text sections that are defined
             assert len(errors) == 0, f"Should not have errors for defined custom section, got: {errors}"
 
-            # Clean up
-            py_file.unlink(missing_ok=True)
-
     def test_37_summary_section_simple_docstring_validation(self) -> None:
         """
         Test that simple docstrings are accepted for summary sections.
@@ -1331,9 +1296,6 @@ class TestDocstringChecker(TestCase):
             # Should validate as true - this tests when: return len(docstring.strip()) > 0
             assert len(errors) == 0, f"Should not have errors for simple summary docstring, got: {errors}"
 
-            # Clean up
-            py_file.unlink(missing_ok=True)
-
     def test_38_summary_section_formal_pattern_validation(self) -> None:
         """
         Test that formal summary patterns are accepted for summary sections.
@@ -1367,9 +1329,6 @@ class TestDocstringChecker(TestCase):
             # Should validate as true - this tests when: return True for formal pattern
             assert len(errors) == 0, f"Should not have errors for formal summary pattern, got: {errors}"
 
-            # Clean up
-            py_file.unlink(missing_ok=True)
-
     def test_39_overload_functions_ignored(self) -> None:
         """
         Test that functions with @overload decorator are ignored.
@@ -1378,7 +1337,7 @@ class TestDocstringChecker(TestCase):
         checker: DocstringChecker = simple_checker()
 
         # Python content with @overload functions
-        python_content: str = dedent(
+        python_content: str = cleandoc(
             '''
             from typing import overload, Union
 
@@ -1408,7 +1367,7 @@ class TestDocstringChecker(TestCase):
                 """
                 pass
             '''
-        ).strip()
+        )
 
         with tempfile.TemporaryDirectory() as temp_dir:
             temp_path = Path(temp_dir)
@@ -1419,9 +1378,6 @@ class TestDocstringChecker(TestCase):
             # Should have no errors - @overload functions are ignored
             assert len(errors) == 0, f"@overload functions should be ignored, got: {errors}"
 
-            # Clean up
-            py_file.unlink(missing_ok=True)
-
     def test_40_overload_functions_with_typing_prefix(self) -> None:
         """
         Test that functions with @typing.overload decorator are ignored.
@@ -1430,7 +1386,7 @@ class TestDocstringChecker(TestCase):
         checker: DocstringChecker = simple_checker()
 
         # Python content with @typing.overload functions
-        python_content: str = dedent(
+        python_content: str = cleandoc(
             '''
             import typing
 
@@ -1453,7 +1409,7 @@ class TestDocstringChecker(TestCase):
                 """
                 return x
             '''
-        ).strip()
+        )
 
         with tempfile.TemporaryDirectory() as temp_dir:
             temp_path = Path(temp_dir)
@@ -1464,9 +1420,6 @@ class TestDocstringChecker(TestCase):
             # Should have no errors - @typing.overload functions are ignored
             assert len(errors) == 0, f"@typing.overload functions should be ignored, got: {errors}"
 
-            # Clean up
-            py_file.unlink(missing_ok=True)
-
     def test_41_overload_missing_implementation_docstring(self) -> None:
         """
         Test that missing docstring on implementation function (not @overload) is caught.
@@ -1475,7 +1428,7 @@ class TestDocstringChecker(TestCase):
         checker: DocstringChecker = simple_checker()
 
         # Python content with @overload functions but missing docstring on implementation
-        python_content: str = dedent(
+        python_content: str = cleandoc(
             """
             from typing import overload, Union
 
@@ -1487,7 +1440,7 @@ class TestDocstringChecker(TestCase):
                 # Missing docstring here
                 return x
             """
-        ).strip()
+        )
 
         with tempfile.TemporaryDirectory() as temp_dir:
             temp_path = Path(temp_dir)
@@ -1502,9 +1455,6 @@ class TestDocstringChecker(TestCase):
             # The error should be on the line of the implementation, not the overloads
             assert errors[0].line_number > 6  # Should be on the implementation line
 
-            # Clean up
-            py_file.unlink(missing_ok=True)
-
     def test_42_mixed_overload_and_regular_functions(self) -> None:
         """
         Test a mix of @overload functions, regular functions with docstrings, and regular functions without.
@@ -1517,7 +1467,7 @@ class TestDocstringChecker(TestCase):
         checker: DocstringChecker = DocstringChecker(_create_config(sections))
 
         # Python content mixing overload and regular functions
-        python_content: str = dedent(
+        python_content: str = cleandoc(
             '''
             from typing import overload, Union
 
@@ -1537,7 +1487,7 @@ class TestDocstringChecker(TestCase):
                 # This one is missing a docstring
                 pass
             '''
-        ).strip()
+        )
 
         with tempfile.TemporaryDirectory() as temp_dir:
             temp_path = Path(temp_dir)
@@ -1550,9 +1500,6 @@ class TestDocstringChecker(TestCase):
             assert "Missing docstring for function" in errors[0].message
             assert errors[0].item_name == "bad_regular_function"
 
-            # Clean up
-            py_file.unlink(missing_ok=True)
-
     def test_43_async_overload_functions(self) -> None:
         """
         Test that async functions with @overload decorator are ignored.
@@ -1561,7 +1508,7 @@ class TestDocstringChecker(TestCase):
         checker: DocstringChecker = simple_checker()
 
         # Python content with async @overload functions
-        python_content: str = dedent(
+        python_content: str = cleandoc(
             '''
             from typing import overload, Union
             import asyncio
@@ -1585,7 +1532,7 @@ class TestDocstringChecker(TestCase):
                 """
                 return x
             '''
-        ).strip()
+        )
 
         with tempfile.TemporaryDirectory() as temp_dir:
             temp_path = Path(temp_dir)
@@ -1596,9 +1543,6 @@ class TestDocstringChecker(TestCase):
             # Should have no errors - async @overload functions are ignored
             assert len(errors) == 0, f"Async @overload functions should be ignored, got: {errors}"
 
-            # Clean up
-            py_file.unlink(missing_ok=True)
-
     def test_44_overload_functions_in_class(self) -> None:
         """
         Test that @overload methods in classes are handled correctly.
@@ -1607,7 +1551,7 @@ class TestDocstringChecker(TestCase):
         checker: DocstringChecker = simple_checker()
 
         # Python content with @overload methods in a class
-        python_content: str = dedent(
+        python_content: str = cleandoc(
             '''
             from typing import overload, Union
 
@@ -1643,7 +1587,7 @@ class TestDocstringChecker(TestCase):
                     """
                     pass
             '''
-        ).strip()
+        )
 
         with tempfile.TemporaryDirectory() as temp_dir:
             temp_path = Path(temp_dir)
@@ -1654,9 +1598,6 @@ class TestDocstringChecker(TestCase):
             # Should have no errors - @overload methods are ignored
             assert len(errors) == 0, f"@overload methods in class should be ignored, got: {errors}"
 
-            # Clean up
-            py_file.unlink(missing_ok=True)
-
     def test_45_overload_detection_helper_method(self) -> None:
         """
         Test the _is_overload_function helper method directly.
@@ -1665,14 +1606,14 @@ class TestDocstringChecker(TestCase):
         checker: DocstringChecker = simple_checker()
 
         # Test direct @overload
-        overload_code: str = dedent(
+        overload_code: str = cleandoc(
             """
             from typing import overload
 
             @overload
             def func(x: int) -> int: ...
         """
-        ).strip()
+        )
 
         tree = ast.parse(overload_code)
         func_node = tree.body[1]  # Second node is the function
@@ -1680,14 +1621,14 @@ class TestDocstringChecker(TestCase):
         assert checker._is_overload_function(func_node), "Should detect @overload decorator"
 
         # Test @typing.overload
-        typing_overload_code: str = dedent(
+        typing_overload_code: str = cleandoc(
             """
             import typing
 
             @typing.overload
             def func(x: int) -> int: ...
         """
-        ).strip()
+        )
 
         tree = ast.parse(typing_overload_code)
         func_node = tree.body[1]  # Second node is the function
@@ -1695,12 +1636,12 @@ class TestDocstringChecker(TestCase):
         assert checker._is_overload_function(func_node), "Should detect @typing.overload decorator"
 
         # Test regular function without @overload
-        regular_code: str = dedent(
+        regular_code: str = cleandoc(
             """
             def func(x: int) -> int:
                 return x
         """
-        ).strip()
+        )
 
         tree = ast.parse(regular_code)
         func_node = tree.body[0]  # First node is the function
@@ -1708,13 +1649,13 @@ class TestDocstringChecker(TestCase):
         assert not checker._is_overload_function(func_node), "Should not detect @overload on regular function"
 
         # Test function with other decorator
-        other_decorator_code: str = dedent(
+        other_decorator_code: str = cleandoc(
             """
             @property
             def func(self):
                 return self._value
         """
-        ).strip()
+        )
 
         tree: Module = ast.parse(other_decorator_code)
         func_node: stmt = tree.body[0]  # First node is the function
@@ -1735,7 +1676,7 @@ class TestDocstringChecker(TestCase):
         checker: DocstringChecker = DocstringChecker(_create_config(sections))
 
         # Python content with correct admonitions
-        python_content: str = dedent(
+        python_content: str = cleandoc(
             '''
             def test_function():
                 """
@@ -1747,7 +1688,7 @@ class TestDocstringChecker(TestCase):
                 """
                 pass
             '''
-        ).strip()
+        )
 
         with tempfile.TemporaryDirectory() as temp_dir:
             temp_path = Path(temp_dir)
@@ -1758,9 +1699,6 @@ class TestDocstringChecker(TestCase):
             # Should have no errors
             assert len(errors) == 0, f"Expected no errors for correct admonitions, got: {[e.message for e in errors]}"
 
-            # Clean up
-            py_file.unlink(missing_ok=True)
-
     def test_47_admonition_validation_incorrect_admonition(self) -> None:
         """
         Test that incorrect admonition values are caught.
@@ -1772,7 +1710,7 @@ class TestDocstringChecker(TestCase):
         checker: DocstringChecker = DocstringChecker(_create_config(sections))
 
         # Python content with wrong admonition for details section
-        python_content: str = dedent(
+        python_content: str = cleandoc(
             '''
             def test_function():
                 """
@@ -1784,7 +1722,7 @@ class TestDocstringChecker(TestCase):
                 """
                 pass
             '''
-        ).strip()
+        )
 
         with tempfile.TemporaryDirectory() as temp_dir:
             temp_path = Path(temp_dir)
@@ -1800,9 +1738,6 @@ class TestDocstringChecker(TestCase):
             assert "abstract" in errors[0].message, f"Expected 'abstract' in error message, got: {errors[0].message}"
             assert "info" in errors[0].message, f"Expected 'info' in error message, got: {errors[0].message}"
 
-            # Clean up
-            py_file.unlink(missing_ok=True)
-
     def test_48_undefined_section_validation_defined_sections(self) -> None:
         """
         Test that sections defined in configuration don't trigger undefined section errors.
@@ -1818,7 +1753,7 @@ class TestDocstringChecker(TestCase):
         checker: DocstringChecker = DocstringChecker(_create_config(sections))
 
         # Python content with only defined sections
-        python_content: str = dedent(
+        python_content: str = cleandoc(
             '''
             def test_function(param1: str) -> bool:
                 """
@@ -1836,7 +1771,7 @@ class TestDocstringChecker(TestCase):
                 """
                 return True
             '''
-        ).strip()
+        )
 
         with tempfile.TemporaryDirectory() as temp_dir:
             temp_path = Path(temp_dir)
@@ -1847,9 +1782,6 @@ class TestDocstringChecker(TestCase):
             # Should have no errors
             assert len(errors) == 0, f"Expected no errors for defined sections, got: {[e.message for e in errors]}"
 
-            # Clean up
-            py_file.unlink(missing_ok=True)
-
     def test_49_undefined_section_validation_undefined_sections(self) -> None:
         """
         Test that sections not defined in configuration trigger undefined section errors.
@@ -1862,7 +1794,7 @@ class TestDocstringChecker(TestCase):
         checker: DocstringChecker = DocstringChecker(_create_config(sections))
 
         # Python content with undefined sections
-        python_content: str = dedent(
+        python_content: str = cleandoc(
             '''
             def test_function(param1: str) -> bool:
                 """
@@ -1883,7 +1815,7 @@ class TestDocstringChecker(TestCase):
                 """
                 return True
             '''
-        ).strip()
+        )
 
         with tempfile.TemporaryDirectory() as temp_dir:
             temp_path = Path(temp_dir)
@@ -1905,9 +1837,6 @@ class TestDocstringChecker(TestCase):
                 has_references_error or has_notes_error
             ), f"Expected undefined section error, got: {errors[0].message}"
 
-            # Clean up
-            py_file.unlink(missing_ok=True)
-
     def test_50_combined_admonition_and_undefined_section_errors(self) -> None:
         """
         Test that both admonition and undefined section errors are caught together.
@@ -1920,7 +1849,7 @@ class TestDocstringChecker(TestCase):
         checker: DocstringChecker = DocstringChecker(_create_config(sections))
 
         # Python content with both wrong admonition AND undefined section
-        python_content: str = dedent(
+        python_content: str = cleandoc(
             '''
             def test_function(param1: str) -> None:
                 """
@@ -1938,7 +1867,7 @@ class TestDocstringChecker(TestCase):
                 """
                 pass
             '''
-        ).strip()
+        )
 
         with tempfile.TemporaryDirectory() as temp_dir:
             temp_path = Path(temp_dir)
@@ -1960,9 +1889,6 @@ class TestDocstringChecker(TestCase):
                 has_undefined_error
             ), f"Expected undefined section error in combined message, got: {errors[0].message}"
 
-            # Clean up
-            py_file.unlink(missing_ok=True)
-
     def test_51_config_validation_admonition_true_error(self) -> None:
         """
         Test that admonition=True raises a validation error.
@@ -2023,7 +1949,7 @@ class TestDocstringChecker(TestCase):
         checker: DocstringChecker = DocstringChecker(_create_config(sections))
 
         # Python content with admonition sections ending with colons (wrong)
-        python_content: str = dedent(
+        python_content: str = cleandoc(
             '''
             def test_function():
                 """
@@ -2035,7 +1961,7 @@ class TestDocstringChecker(TestCase):
                 """
                 pass
             '''
-        ).strip()
+        )
 
         with tempfile.TemporaryDirectory() as temp_dir:
             temp_path = Path(temp_dir)
@@ -2052,9 +1978,6 @@ class TestDocstringChecker(TestCase):
             colon_error_count >= 2
         ), f"Expected at least 2 colon violations in error message, got: {colon_error_count}"
 
-        # Clean up
-        py_file.unlink(missing_ok=True)
-
     def test_56_colon_validation_non_admonition_sections_must_have_colon(self) -> None:
         """
         Test that non-admonition sections without colons trigger validation errors.
@@ -2067,7 +1990,7 @@ class TestDocstringChecker(TestCase):
         checker: DocstringChecker = DocstringChecker(_create_config(sections))
 
         # Python content with non-admonition sections missing colons (wrong)
-        python_content: str = dedent(
+        python_content: str = cleandoc(
             '''
             def test_function(param1: str) -> bool:
                 """
@@ -2082,7 +2005,7 @@ class TestDocstringChecker(TestCase):
                 """
                 return True
             '''
-        ).strip()
+        )
 
         with tempfile.TemporaryDirectory() as temp_dir:
             temp_path = Path(temp_dir)
@@ -2099,9 +2022,6 @@ class TestDocstringChecker(TestCase):
                 colon_error_count >= 3
             ), f"Expected at least 3 colon violations in error message, got: {colon_error_count}"
 
-            # Clean up
-            py_file.unlink(missing_ok=True)
-
     def test_57_title_case_validation_non_admonition_sections(self) -> None:
         """
         Test that non-admonition sections must be in title case.
@@ -2114,7 +2034,7 @@ class TestDocstringChecker(TestCase):
         checker: DocstringChecker = DocstringChecker(_create_config(sections))
 
         # Python content with wrong case sections
-        python_content: str = dedent(
+        python_content: str = cleandoc(
             '''
             def test_function(param1: str) -> bool:
                 """
@@ -2129,7 +2049,7 @@ class TestDocstringChecker(TestCase):
                 """
                 return True
             '''
-        ).strip()
+        )
 
         with tempfile.TemporaryDirectory() as temp_dir:
             temp_path = Path(temp_dir)
@@ -2146,9 +2066,6 @@ class TestDocstringChecker(TestCase):
                 case_error_count >= 2
             ), f"Expected at least 2 title case violations in error message, got: {case_error_count}"
 
-            # Clean up
-            py_file.unlink(missing_ok=True)
-
     def test_58_parentheses_validation_list_type_sections(self) -> None:
         """
         Test that list_type sections require parenthesized types.
@@ -2165,7 +2082,7 @@ class TestDocstringChecker(TestCase):
         checker: DocstringChecker = DocstringChecker(_create_config(sections))
 
         # Python content with missing parentheses in list_type sections
-        python_content: str = dedent(
+        python_content: str = cleandoc(
             '''
             def test_function() -> bool:
                 """
@@ -2185,7 +2102,7 @@ class TestDocstringChecker(TestCase):
                 """
                 return True
             '''
-        ).strip()
+        )
 
         with tempfile.TemporaryDirectory() as temp_dir:
             temp_path = Path(temp_dir)
@@ -2202,9 +2119,6 @@ class TestDocstringChecker(TestCase):
         error_message: str = errors[0].message
         assert "undefined" in error_message.lower(), f"Expected undefined section error, got: {error_message}"
 
-        # Clean up
-        py_file.unlink(missing_ok=True)
-
     def test_59_parentheses_validation_list_name_and_type_sections(self) -> None:
         """
         Test that list_name_and_type sections require parenthesized types.
@@ -2217,7 +2131,7 @@ class TestDocstringChecker(TestCase):
         checker: DocstringChecker = DocstringChecker(_create_config(sections))
 
         # Python content with missing parentheses in list_name_and_type sections
-        python_content: str = dedent(
+        python_content: str = cleandoc(
             '''
             def test_function(param1: str, param2: int) -> bool:
                 """
@@ -2236,7 +2150,7 @@ class TestDocstringChecker(TestCase):
                 """
                 return True
             '''
-        ).strip()
+        )
 
         with tempfile.TemporaryDirectory() as temp_dir:
             temp_path = Path(temp_dir)
@@ -2253,9 +2167,6 @@ class TestDocstringChecker(TestCase):
                 parentheses_error_count >= 3
             ), f"Expected at least 3 parentheses violations in error message, got: {parentheses_error_count}"
 
-            # Clean up
-            py_file.unlink(missing_ok=True)
-
     def test_60_correct_validation_with_all_new_rules(self) -> None:
         """
         Test that properly formatted docstring with all new rules passes validation.
@@ -2273,7 +2184,7 @@ class TestDocstringChecker(TestCase):
         checker: DocstringChecker = DocstringChecker(_create_config(sections))
 
         # Python content following all the new validation rules correctly
-        python_content: str = dedent(
+        python_content: str = cleandoc(
             '''
             def test_function(param1: str, param2: int) -> bool:
                 """
@@ -2304,7 +2215,7 @@ class TestDocstringChecker(TestCase):
                 """
                 return True
             '''
-        ).strip()
+        )
 
         with tempfile.TemporaryDirectory() as temp_dir:
             temp_path = Path(temp_dir)
@@ -2317,9 +2228,6 @@ class TestDocstringChecker(TestCase):
                 len(errors) == 0
             ), f"Expected no errors for correctly formatted docstring, got: {[e.message for e in errors]}"
 
-            # Clean up
-            py_file.unlink(missing_ok=True)
-
     def test_61_unknown_free_text_section_default_return(self) -> None:
         """
         Test that unknown free text sections return True by default.
@@ -2330,7 +2238,7 @@ class TestDocstringChecker(TestCase):
         ]
         checker: DocstringChecker = DocstringChecker(_create_config(sections))
 
-        python_content: str = dedent(
+        python_content: str = cleandoc(
             '''
             def test_function():
                 """
@@ -2339,7 +2247,7 @@ class TestDocstringChecker(TestCase):
                 """
                 pass
             '''
-        ).strip()
+        )
 
         with tempfile.TemporaryDirectory() as temp_dir:
             temp_path = Path(temp_dir)
@@ -2360,7 +2268,7 @@ class TestDocstringChecker(TestCase):
         ]
         checker: DocstringChecker = DocstringChecker(_create_config(sections))
 
-        python_content: str = dedent(
+        python_content: str = cleandoc(
             r'''
             def test_function():
                 """
@@ -2390,7 +2298,7 @@ class TestDocstringChecker(TestCase):
                 """
                 pass
             '''
-        ).strip()
+        )
 
         with tempfile.TemporaryDirectory() as temp_dir:
             temp_path = Path(temp_dir)
@@ -2817,7 +2725,7 @@ class TestDocstringChecker(TestCase):
         checker: DocstringChecker = DocstringChecker(_create_config(sections))
 
         # Test with content that has description lines with specific words that should be skipped
-        python_content: str = dedent(
+        python_content: str = cleandoc(
             '''
             def test_function():
                 """
@@ -2833,7 +2741,7 @@ class TestDocstringChecker(TestCase):
                 """
                 pass
             '''
-        ).strip()
+        )
 
         with tempfile.TemporaryDirectory() as temp_dir:
             temp_path = Path(temp_dir)
@@ -2859,9 +2767,6 @@ class TestDocstringChecker(TestCase):
             "Show examples:" not in error_message
         ), f"Should not have error for 'Show examples:' line, got: {error_message}"
 
-        # Clean up
-        py_file.unlink(missing_ok=True)
-
     def test_77_parentheses_validation_specific_error_line(self) -> None:
         """
         Test that hits the specific error append line (line 980) in core.py.
@@ -2873,7 +2778,7 @@ class TestDocstringChecker(TestCase):
         checker: DocstringChecker = DocstringChecker(_create_config(sections))
 
         # Simple content that should definitely trigger the parentheses error
-        python_content: str = dedent(
+        python_content: str = cleandoc(
             '''
             def test_function():
                 """
@@ -2885,7 +2790,7 @@ class TestDocstringChecker(TestCase):
                 """
                 pass
             '''
-        ).strip()
+        )
 
         with tempfile.TemporaryDirectory() as temp_dir:
             temp_path = Path(temp_dir)
@@ -2899,9 +2804,6 @@ class TestDocstringChecker(TestCase):
         assert "parenthesized types" in error_message, f"Expected parentheses error, got: {error_message}"
         assert "simple_param_name" in error_message, f"Expected error for simple_param_name, got: {error_message}"
 
-        # Clean up
-        py_file.unlink(missing_ok=True)
-
     def test_78_parentheses_validation_alternative_trigger(self) -> None:
         """
         Another attempt to hit the missing line in parentheses validation.
@@ -2913,7 +2815,7 @@ class TestDocstringChecker(TestCase):
         checker: DocstringChecker = DocstringChecker(_create_config(sections))
 
         # Test case where we have a clear parameter line that lacks parentheses
-        python_content: str = dedent(
+        python_content: str = cleandoc(
             '''
             def test_function():
                 """
@@ -2925,7 +2827,7 @@ class TestDocstringChecker(TestCase):
                 """
                 pass
             '''
-        ).strip()
+        )
 
         with tempfile.TemporaryDirectory() as temp_dir:
             temp_path = Path(temp_dir)
@@ -2940,9 +2842,6 @@ class TestDocstringChecker(TestCase):
             "parenthesized types" in error_message and "x:" in error_message
         ), f"Expected parentheses error for 'x:', got: {error_message}"
 
-        # Clean up
-        py_file.unlink(missing_ok=True)
-
     def test_79_specific_parentheses_validation_line_target(self) -> None:
         """
         Test to specifically target core.py line 998 with exact condition.
@@ -2955,7 +2854,7 @@ class TestDocstringChecker(TestCase):
 
         # Create a parameter line that will pass all the filter conditions but fail the regex
         # This should hit the exact line we're targeting (core.py:998)
-        python_content: str = dedent(
+        python_content: str = cleandoc(
             '''
             def test_function():
                 """
@@ -2967,7 +2866,7 @@ class TestDocstringChecker(TestCase):
                 """
                 pass
             '''
-        ).strip()
+        )
 
         with tempfile.TemporaryDirectory() as temp_dir:
             temp_path = Path(temp_dir)
@@ -2981,9 +2880,6 @@ class TestDocstringChecker(TestCase):
         ]
         assert len(parentheses_errors) > 0, f"Expected parentheses error, got errors: {[e.message for e in errors]}"
 
-        # Clean up
-        py_file.unlink(missing_ok=True)
-
     def test_80_precise_parentheses_validation_coverage(self) -> None:
         """
         Test to precisely hit core.py line 998 - parentheses error creation.
@@ -2999,7 +2895,7 @@ class TestDocstringChecker(TestCase):
         # - Line has colon but no parentheses
         # - Line doesn't contain filter words ("default", "output", "format", "show", "example")
         # - Line fails the regex r"\([^)]+\):"
-        python_content: str = dedent(
+        python_content: str = cleandoc(
             '''
             def test_function():
                 """
@@ -3011,7 +2907,7 @@ class TestDocstringChecker(TestCase):
                 """
                 pass
             '''
-        ).strip()
+        )
 
         with tempfile.TemporaryDirectory() as temp_dir:
             temp_path = Path(temp_dir)
@@ -3027,9 +2923,6 @@ class TestDocstringChecker(TestCase):
             len(parentheses_errors) > 0
         ), f"Expected parentheses error containing 'param:', got errors: {[e.message for e in errors]}"
 
-        # Clean up
-        py_file.unlink(missing_ok=True)
-
     def test_81_continue_statement_for_description_words(self) -> None:
         """
         Test that line 998 (continue statement) is hit when lines contain description words.
@@ -3042,7 +2935,7 @@ class TestDocstringChecker(TestCase):
         ]
         checker = DocstringChecker(_create_config(sections))
 
-        python_content: str = dedent(
+        python_content: str = cleandoc(
             '''
             def test_function(param1, param2):
                 """
@@ -3055,7 +2948,7 @@ class TestDocstringChecker(TestCase):
                 """
                 pass
             '''
-        ).strip()
+        )
 
         with tempfile.TemporaryDirectory() as temp_dir:
             temp_path = Path(temp_dir)
@@ -3079,9 +2972,6 @@ class TestDocstringChecker(TestCase):
             any(word in err.message.lower() for word in ["default:", "output:"]) for err in parentheses_errors
         ), f"Expected no parentheses errors for description lines, got: {[e.message for e in parentheses_errors]}"
 
-        # Clean up
-        py_file.unlink(missing_ok=True)
-
     def test_82_list_type_description_lines_with_colons(self) -> None:
         """
         Test that description lines in list_type sections with colons don't trigger parentheses errors.
@@ -3095,7 +2985,7 @@ class TestDocstringChecker(TestCase):
         checker: DocstringChecker = DocstringChecker(_create_config(sections))
 
         # Test case 1: Description on separate lines (should pass)
-        python_content_1: str = dedent(
+        python_content_1: str = cleandoc(
             '''
             def test_function():
                 """
@@ -3107,10 +2997,10 @@ class TestDocstringChecker(TestCase):
                 """
                 pass
             '''
-        ).strip()
+        )
 
         # Test case 2: Description on same line (should pass)
-        python_content_2: str = dedent(
+        python_content_2: str = cleandoc(
             '''
             def test_function_same_line():
                 """
@@ -3121,10 +3011,10 @@ class TestDocstringChecker(TestCase):
                 """
                 pass
             '''
-        ).strip()
+        )
 
         # Test case 3: Invalid format (should fail)
-        python_content_3: str = dedent(
+        python_content_3: str = cleandoc(
             '''
             def test_function_invalid():
                 """
@@ -3135,7 +3025,7 @@ class TestDocstringChecker(TestCase):
                 """
                 pass
             '''
-        ).strip()
+        )
 
         with tempfile.TemporaryDirectory() as temp_dir:
             temp_path = Path(temp_dir)
@@ -3180,7 +3070,7 @@ class TestDocstringChecker(TestCase):
         ]
         checker: DocstringChecker = DocstringChecker(_create_config(sections))
 
-        python_content: str = dedent(
+        python_content: str = cleandoc(
             '''
             def function_with_malformed_type():
                 """
@@ -3192,7 +3082,7 @@ class TestDocstringChecker(TestCase):
                 """
                 pass
             '''
-        ).strip()
+        )
 
         with tempfile.NamedTemporaryFile(mode="w", suffix=".py", delete=False) as temp_file:
             temp_file.write(python_content)
@@ -3229,7 +3119,7 @@ class TestDocstringChecker(TestCase):
         ]
         checker: DocstringChecker = DocstringChecker(_create_config(sections, optional_style="silent"))
 
-        python_content: str = dedent(
+        python_content: str = cleandoc(
             '''
             def function_with_description_lines():
                 """
@@ -3254,7 +3144,7 @@ class TestDocstringChecker(TestCase):
                 """
                 pass
             '''
-        ).strip()
+        )
 
         with tempfile.NamedTemporaryFile(mode="w", suffix=".py", delete=False) as temp_file:
             temp_file.write(python_content)
@@ -3284,7 +3174,7 @@ class TestDocstringChecker(TestCase):
         ]
         checker: DocstringChecker = DocstringChecker(_create_config(sections))
 
-        python_content: str = dedent(
+        python_content: str = cleandoc(
             '''
             def function_with_indented_descriptions():
                 """
@@ -3297,7 +3187,7 @@ class TestDocstringChecker(TestCase):
                 """
                 pass
             '''
-        ).strip()
+        )
 
         with tempfile.NamedTemporaryFile(mode="w", suffix=".py", delete=False) as temp_file:
             temp_file.write(python_content)
@@ -3325,7 +3215,7 @@ class TestDocstringChecker(TestCase):
         ]
         checker: DocstringChecker = DocstringChecker(_create_config(sections))
 
-        python_content: str = dedent(
+        python_content: str = cleandoc(
             '''
             def function_with_multiple_word_descriptions():
                 """
@@ -3337,7 +3227,7 @@ class TestDocstringChecker(TestCase):
                 """
                 pass
             '''
-        ).strip()
+        )
 
         with tempfile.NamedTemporaryFile(mode="w", suffix=".py", delete=False) as temp_file:
             temp_file.write(python_content)
@@ -3368,7 +3258,7 @@ class TestDocstringChecker(TestCase):
         ]
         checker: DocstringChecker = DocstringChecker(_create_config(sections))
 
-        python_content: str = dedent(
+        python_content: str = cleandoc(
             '''
             def function_with_same_level_multiple_words():
                 """
@@ -3381,7 +3271,7 @@ class TestDocstringChecker(TestCase):
                 """
                 pass
             '''
-        ).strip()
+        )
 
         with tempfile.NamedTemporaryFile(mode="w", suffix=".py", delete=False) as temp_file:
             temp_file.write(python_content)
@@ -3731,7 +3621,7 @@ class TestUnorderedSections(TestCase):
         Test unordered section appearing before ordered sections.
         """
         checker: DocstringChecker = self._create_unordered_checker()
-        docstring: str = dedent(
+        docstring: str = cleandoc(
             """
             !!! deprecation "Deprecation Warning"
                 This function is deprecated.
@@ -3743,7 +3633,7 @@ class TestUnorderedSections(TestCase):
                 x (int): The input.
                 y (int): Another input.
             """
-        ).strip()
+        )
         errors: list[DocstringError] = self._check_docstring(checker, docstring)
         assert len(errors) == 0, f"Expected no errors, got: {[e.message for e in errors]}"
 
@@ -3752,7 +3642,7 @@ class TestUnorderedSections(TestCase):
         Test unordered section appearing between ordered sections.
         """
         checker: DocstringChecker = self._create_unordered_checker()
-        docstring: str = dedent(
+        docstring: str = cleandoc(
             """
             !!! note "Summary"
                 A simple function.
@@ -3764,7 +3654,7 @@ class TestUnorderedSections(TestCase):
                 x (int): The input.
                 y (int): Another input.
             """
-        ).strip()
+        )
         errors: list[DocstringError] = self._check_docstring(checker, docstring)
         assert len(errors) == 0, f"Expected no errors, got: {[e.message for e in errors]}"
 
@@ -3773,7 +3663,7 @@ class TestUnorderedSections(TestCase):
         Test unordered section appearing after ordered sections.
         """
         checker: DocstringChecker = self._create_unordered_checker()
-        docstring: str = dedent(
+        docstring: str = cleandoc(
             """
             !!! note "Summary"
                 A simple function.
@@ -3785,7 +3675,7 @@ class TestUnorderedSections(TestCase):
             !!! deprecation "Deprecation Warning"
                 This function is deprecated.
             """
-        ).strip()
+        )
         errors: list[DocstringError] = self._check_docstring(checker, docstring)
         assert len(errors) == 0, f"Expected no errors, got: {[e.message for e in errors]}"
 
@@ -3794,7 +3684,7 @@ class TestUnorderedSections(TestCase):
         Test multiple unordered sections in various positions.
         """
         checker: DocstringChecker = self._create_unordered_checker()
-        docstring: str = dedent(
+        docstring: str = cleandoc(
             """
             !!! todo "Todo"
                 Fix this later.
@@ -3812,7 +3702,7 @@ class TestUnorderedSections(TestCase):
             Custom List:
                 - Item 1
             """
-        ).strip()
+        )
         errors: list[DocstringError] = self._check_docstring(checker, docstring)
         assert len(errors) == 0, f"Expected no errors, got: {[e.message for e in errors]}"
 
@@ -3821,7 +3711,7 @@ class TestUnorderedSections(TestCase):
         Test unordered section appearing inside a parameter description.
         """
         checker: DocstringChecker = self._create_unordered_checker()
-        docstring: str = dedent(
+        docstring: str = cleandoc(
             """
             !!! note "Summary"
                 A simple function.
@@ -3833,7 +3723,7 @@ class TestUnorderedSections(TestCase):
                         This parameter is deprecated.
                 y (int): Another input.
             """
-        ).strip()
+        )
         errors: list[DocstringError] = self._check_docstring(checker, docstring)
         assert len(errors) == 0, f"Expected no errors, got: {[e.message for e in errors]}"
 
@@ -3842,7 +3732,7 @@ class TestUnorderedSections(TestCase):
         Test unordered sections of different types (free_text, list_name).
         """
         checker: DocstringChecker = self._create_unordered_checker()
-        docstring: str = dedent(
+        docstring: str = cleandoc(
             """
             !!! note "Summary"
                 A simple function.
@@ -3854,7 +3744,7 @@ class TestUnorderedSections(TestCase):
                 x (int): The input.
                 y (int): Another input.
             """
-        ).strip()
+        )
         errors: list[DocstringError] = self._check_docstring(checker, docstring)
         assert len(errors) == 0, f"Expected no errors, got: {[e.message for e in errors]}"
 
@@ -3869,12 +3759,12 @@ class TestUnorderedSections(TestCase):
         config = Config(global_config=GlobalConfig(), sections=sections)
         checker: DocstringChecker = DocstringChecker(config)
 
-        docstring: str = dedent(
+        docstring: str = cleandoc(
             """
             !!! note "Summary"
                 A simple function.
             """
-        ).strip()
+        )
         errors: list[DocstringError] = self._check_docstring(checker, docstring)
         assert any(
             "Missing required section: 'mandatory unordered'" in err.message for err in errors
@@ -3885,7 +3775,7 @@ class TestUnorderedSections(TestCase):
         Test that unordered sections are matched case-insensitively.
         """
         checker: DocstringChecker = self._create_unordered_checker()
-        docstring: str = dedent(
+        docstring: str = cleandoc(
             """
             !!! note "Summary"
                 A simple function.
@@ -3897,7 +3787,7 @@ class TestUnorderedSections(TestCase):
                 x (int): The input.
                 y (int): Another input.
             """
-        ).strip()
+        )
         errors: list[DocstringError] = self._check_docstring(checker, docstring)
         assert len(errors) == 0, f"Expected no errors, got: {[e.message for e in errors]}"
 
@@ -3906,7 +3796,7 @@ class TestUnorderedSections(TestCase):
         Test that unordered sections don't mask order errors in ordered sections.
         """
         checker: DocstringChecker = self._create_unordered_checker()
-        docstring: str = dedent(
+        docstring: str = cleandoc(
             """
             Params:
                 x (int): The input.
@@ -3918,7 +3808,7 @@ class TestUnorderedSections(TestCase):
             !!! note "Summary"
                 A simple function.
             """
-        ).strip()
+        )
         errors: list[DocstringError] = self._check_docstring(checker, docstring)
         # Summary (order 1) appears after Params (order 2)
         assert any(
@@ -6112,7 +6002,7 @@ class TestParameterTypeValidation(TestCase):
         """
         Test that positional-only parameters (before /) are properly extracted and validated.
         """
-        python_content: str = dedent(
+        python_content: str = cleandoc(
             """
             def test_function(a: int, b: str, /, c: float) -> None:
                 '''
@@ -6128,7 +6018,7 @@ class TestParameterTypeValidation(TestCase):
                 '''
                 pass
             """
-        ).strip()
+        )
 
         checker: DocstringChecker = simple_checker()
 
@@ -6147,7 +6037,7 @@ class TestParameterTypeValidation(TestCase):
         """
         Test that *args parameters are properly extracted and validated.
         """
-        python_content: str = dedent(
+        python_content: str = cleandoc(
             """
             def test_function(a: int, *args: str) -> None:
                 '''
@@ -6161,7 +6051,7 @@ class TestParameterTypeValidation(TestCase):
                 '''
                 pass
             """
-        ).strip()
+        )
 
         checker: DocstringChecker = simple_checker()
 
@@ -6180,7 +6070,7 @@ class TestParameterTypeValidation(TestCase):
         """
         Test that **kwargs parameters are properly extracted and validated.
         """
-        python_content: str = dedent(
+        python_content: str = cleandoc(
             """
             def test_function(a: int, **kwargs: str) -> None:
                 '''
@@ -6194,7 +6084,7 @@ class TestParameterTypeValidation(TestCase):
                 '''
                 pass
             """
-        ).strip()
+        )
 
         checker: DocstringChecker = simple_checker()
 
@@ -6213,7 +6103,7 @@ class TestParameterTypeValidation(TestCase):
         """
         Test that all parameter types work together correctly.
         """
-        python_content: str = dedent(
+        python_content: str = cleandoc(
             """
             def test_function(a: int, b: str, /, c: float, *args: int, d: bool, **kwargs: str) -> None:
                 '''
@@ -6235,7 +6125,7 @@ class TestParameterTypeValidation(TestCase):
                 '''
                 pass
             """
-        ).strip()
+        )
 
         checker: DocstringChecker = simple_checker()
 
@@ -6257,7 +6147,7 @@ class TestParameterTypeValidation(TestCase):
         This is the original issue - @overload functions have different signatures,
         but only the final implementation should be checked against the docstring.
         """
-        python_content: str = dedent(
+        python_content: str = cleandoc(
             '''
             from typing import overload, Literal, Optional
 
@@ -6294,7 +6184,7 @@ class TestParameterTypeValidation(TestCase):
                 """
                 pass
             '''
-        ).strip()
+        )
 
         checker: DocstringChecker = simple_checker()
 
@@ -6415,7 +6305,7 @@ class TestParameterTypeValidation(TestCase):
         """
         Test formatting of optional suffix errors when there's only one error.
         """
-        python_content: str = dedent(
+        python_content: str = cleandoc(
             """
             def test_function(a: int = 5) -> None:
                 '''
@@ -6427,7 +6317,7 @@ class TestParameterTypeValidation(TestCase):
                 '''
                 pass
             """
-        ).strip()
+        )
 
         sections: list[SectionConfig] = [
             SectionConfig(order=1, name="Params", type="list_name_and_type", required=True),
@@ -6453,7 +6343,7 @@ class TestParameterTypeValidation(TestCase):
         """
         Test formatting of optional suffix errors when there are multiple errors.
         """
-        python_content: str = dedent(
+        python_content: str = cleandoc(
             """
             def test_function(a: int = 5, b: str = "default", c: float = 1.0) -> None:
                 '''
@@ -6469,7 +6359,7 @@ class TestParameterTypeValidation(TestCase):
                 '''
                 pass
             """
-        ).strip()
+        )
 
         sections: list[SectionConfig] = [
             SectionConfig(order=1, name="Params", type="list_name_and_type", required=True),
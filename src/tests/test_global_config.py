@@ -12,8 +12,8 @@
 # ## Python StdLib Imports ----
 import sys
 import tempfile
+from inspect import cleandoc
 from pathlib import Path
-from textwrap import dedent
 from unittest import TestCase
 
 # ## Python Third Party Imports ----
@@ -47,7 +47,7 @@ class TestGlobalConfigFeatures(TestCase):
         Test loading global config flags from TOML file.
         """
 
-        toml_content: str = dedent(
+        toml_content: str = cleandoc(
             """
             [tool.dfc]
             allow_undefined_sections = true
@@ -60,7 +60,7 @@ class TestGlobalConfigFeatures(TestCase):
             type = "free_text"
             required = true
             """
-        ).strip()
+        )
 
         with tempfile.NamedTemporaryFile(mode="w", suffix=".toml", delete=False) as f:
             f.write(toml_content)
@@ -94,7 +94,7 @@ class TestGlobalConfigFeatures(TestCase):
         Test that default global config values are used when not specified in TOML.
         """
 
-        toml_content: str = dedent(
+        toml_content: str = cleandoc(
             """
             [tool.dfc]
 
@@ -104,7 +104,7 @@ class TestGlobalConfigFeatures(TestCase):
             type = "free_text"
             required = true
             """
-        ).strip()
+        )
 
         with tempfile.NamedTemporaryFile(mode="w", suffix=".toml", delete=False) as f:
             f.write(toml_content)
@@ -137,7 +137,7 @@ class TestGlobalConfigFeatures(TestCase):
         checker = DocstringChecker(config)
 
         # Create a Python file with an undefined section
-        python_content: str = dedent(
+        python_content: str = cleandoc(
             '''
             def test_function():
                 """
@@ -149,7 +149,7 @@ class TestGlobalConfigFeatures(TestCase):
                 """
                 pass
             '''
-        ).strip()
+        )
 
         with tempfile.NamedTemporaryFile(mode="w", suffix=".py", delete=False) as f:
             f.write(python_content)
@@ -180,7 +180,7 @@ class TestGlobalConfigFeatures(TestCase):
         checker = DocstringChecker(config)
 
         # Create a Python file with an undefined section
-        python_content: str = dedent(
+        python_content: str = cleandoc(
             '''
             def test_function():
                 """
@@ -192,7 +192,7 @@ class TestGlobalConfigFeatures(TestCase):
                 """
                 pass
             '''
-        ).strip()
+        )
 
         with tempfile.NamedTemporaryFile(mode="w", suffix=".py", delete=False) as f:
             f.write(python_content)
@@ -222,12 +222,12 @@ class TestGlobalConfigFeatures(TestCase):
         checker = DocstringChecker(config)
 
         # Create a Python file with a function missing docstring
-        python_content: str = dedent(
+        python_content: str = cleandoc(
             """
             def test_function():
                 pass
             """
-        ).strip()
+        )
 
         with tempfile.NamedTemporaryFile(mode="w", suffix=".py", delete=False) as f:
             f.write(python_content)
@@ -258,12 +258,12 @@ class TestGlobalConfigFeatures(TestCase):
         checker = DocstringChecker(config)
 
         # Create a Python file with a function missing docstring
-        python_content: str = dedent(
+        python_content: str = cleandoc(
             """
             def test_function():
                 pass
             """
-        ).strip()
+        )
 
         with tempfile.NamedTemporaryFile(mode="w", suffix=".py", delete=False) as f:
             f.write(python_content)
@@ -293,7 +293,7 @@ class TestGlobalConfigFeatures(TestCase):
         checker = DocstringChecker(config)
 
         # Create a Python file with private functions missing docstrings
-        python_content: str = dedent(
+        python_content: str = cleandoc(
             """
             def _private_function():
                 pass
@@ -301,7 +301,7 @@ class TestGlobalConfigFeatures(TestCase):
             def __dunder_function__():
                 pass
             """
-        ).strip()
+        )
 
         with tempfile.NamedTemporaryFile(mode="w", suffix=".py", delete=False) as f:
             f.write(python_content)
@@ -330,7 +330,7 @@ class TestGlobalConfigFeatures(TestCase):
         checker = DocstringChecker(config)
 
         # Create a Python file with private functions missing docstrings
-        python_content: str = dedent(
+        python_content: str = cleandoc(
             """
             def _private_function():
                 pass
@@ -338,7 +338,7 @@ class TestGlobalConfigFeatures(TestCase):
             def __dunder_function__():
                 pass
             """
-        ).strip()
+        )
 
         with tempfile.NamedTemporaryFile(mode="w", suffix=".py", delete=False) as f:
             f.write(python_content)
@@ -372,7 +372,7 @@ class TestGlobalConfigFeatures(TestCase):
         checker = DocstringChecker(config)
 
         # Create a Python file with private function with undefined section
-        python_content = dedent(
+        python_content = cleandoc(
             '''
             def _private_function():
                 """
@@ -387,7 +387,7 @@ class TestGlobalConfigFeatures(TestCase):
             def public_function_no_docstring():
                 pass
             '''
-        ).strip()
+        )
 
         with tempfile.NamedTemporaryFile(mode="w", suffix=".py", delete=False) as f:
             f.write(python_content)
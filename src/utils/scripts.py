@@ -261,7 +261,7 @@ def check_mkdocs() -> None:
 
 
 def check_pytest() -> None:
-    run("pytest --config-file=pyproject.toml")
+    run("pytest --config-file=pyproject.toml --numprocesses=auto")
 
 
 def check_docstrings() -> None: